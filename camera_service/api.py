@@ -3,21 +3,40 @@ FastAPI application for Pi Camera Service.
 
 Provides HTTP API for controlling Raspberry Pi camera including exposure,
 white balance, and RTSP streaming to MediaMTX.
+
+Endpoints are async and expect to be served by uvicorn with uvloop and
+httptools (see main.py); both are listed in requirements.txt.
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
+import contextlib
+import hashlib
+import inspect
 import logging
+import queue
+import secrets
 import subprocess
+import time
 from contextlib import asynccontextmanager
-from threading import RLock
-from typing import Annotated, AsyncGenerator, Optional
-
-from fastapi import Depends, FastAPI, HTTPException, Query, Security, status
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
+from typing import Annotated, Any, AsyncGenerator, Callable, Literal, Optional, get_type_hints
+
+import anyio
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
-from fastapi.security import APIKeyHeader
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from camera_service.camera_controller import CameraController, MAX_EXPOSURE_US, MAX_GAIN
 from camera_service.config import CONFIG
@@ -31,53 +50,177 @@ from camera_service.exceptions import (
 from camera_service.streaming_manager import StreamingManager
 from camera_service.system_monitor import SystemMonitor
 
-# Configure logging
-logging.basicConfig(
-    level=CONFIG.log_level,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Global instances (initialized in lifespan)
+# Log records are queued by the calling thread and written to stderr by a
+# listener thread, so request handlers never block on log I/O
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = QueueHandler(_log_queue)
+_log_listener: QueueListener | None = None
+
+# Global instances (camera and streaming initialized in lifespan, system
+# monitor on first use)
 camera_controller: CameraController | None = None
 streaming_manager: StreamingManager | None = None
 system_monitor: SystemMonitor | None = None
+_system_monitor_lock = Lock()
+_service_start_time = time.time()
+
+# Serialized capabilities response and its ETag, built on first use and
+# dropped whenever a resolution or framerate change alters the reported limits
+_capabilities_cache: tuple[bytes, str] | None = None
+
+# Last system status as (expiry per time.monotonic(), JSON body, ETag), kept
+# for CONFIG.system_status_ttl. The lock makes concurrent pollers of an expired
+# entry wait for a single monitor scan instead of each starting one.
+_system_status_cache: tuple[float, bytes, str] | None = None
+_system_status_lock = asyncio.Lock()
 
 # Global lock for camera reconfiguration operations
-# Protects sequences that require stopping/reconfiguring/restarting streaming
-_reconfiguration_lock = RLock()
+# Protects sequences that require stopping/reconfiguring/restarting streaming.
+# Waiters queue on the event loop instead of holding worker threads; the
+# blocking steps inside are offloaded to the threadpool.
+_reconfiguration_lock = asyncio.Lock()
 
 # API Key authentication
-api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+# Configured API key, encoded once for constant-time comparison
+_API_KEY_BYTES = CONFIG.api_key.encode("utf-8") if CONFIG.api_key else None
+
+# Successfully verified API keys mapped to their expiry (time.monotonic())
+_auth_cache: dict[str, float] = {}
+_AUTH_TTL = 30.0
+
+# Pre-built errors for the "not ready" paths. Starlette's handler only reads
+# status_code/detail/headers, so sharing instances is safe; the traceback is
+# reset on each raise so it does not accumulate frames.
+_HTTP_503_CAMERA = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Camera not initialized",
+)
+_HTTP_503_STREAMING = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Streaming manager not initialized",
+)
 
 
-def verify_api_key(api_key: str | None = Security(api_key_header)) -> None:
+def _http_500(detail: str) -> HTTPException:
+    return HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail)
+
+
+# Same for the fixed-detail failure paths of individual endpoints
+_HTTP_500_STATUS = _http_500("Failed to retrieve camera status")
+_HTTP_500_CAPABILITIES = _http_500("Failed to retrieve camera capabilities")
+_HTTP_500_AUTO_EXPOSURE = _http_500("Failed to set auto exposure")
+_HTTP_500_MANUAL_EXPOSURE = _http_500("Failed to set manual exposure")
+_HTTP_500_AWB = _http_500("Failed to set AWB")
+_HTTP_500_STREAMING_START = _http_500("Failed to start streaming")
+_HTTP_500_STREAMING_STOP = _http_500("Failed to stop streaming")
+_HTTP_500_SNAPSHOT = _http_500("Failed to capture snapshot")
+_HTTP_500_RESOLUTION = _http_500("Failed to set resolution")
+_HTTP_500_FRAMERATE = _http_500("Failed to set framerate")
+_HTTP_500_GET_FOV_MODE = _http_500("Failed to get FOV mode")
+_HTTP_500_SET_FOV_MODE = _http_500("Failed to set FOV mode")
+_HTTP_500_SYSTEM_STATUS = _http_500("Failed to get system status")
+_HTTP_504_LOGS = HTTPException(status.HTTP_504_GATEWAY_TIMEOUT, "Log retrieval timed out")
+
+
+def _is_valid_api_key(api_key: str | None) -> bool:
     """
-    Verify API key for authentication.
+    Check an X-API-Key header value against the configured key.
 
     Args:
-        api_key: API key from X-API-Key header
+        api_key: Header value, or None if the header was not sent
 
-    Raises:
-        HTTPException: If authentication is required and key is invalid
+    Returns:
+        bool: True if the key matches the configured API key
     """
-    # If no API key is configured, skip authentication
-    if CONFIG.api_key is None:
-        logger.debug("API authentication disabled (no API key configured)")
-        return
+    if api_key is None:
+        return False
 
-    # If API key is configured, require it
-    if api_key is None or api_key != CONFIG.api_key:
-        logger.warning("Authentication failed: invalid or missing API key")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing API key",
-            headers={"WWW-Authenticate": "ApiKey"},
-        )
+    # Recently verified key: skip the comparison until the entry expires
+    if _auth_cache.get(api_key, 0.0) > time.monotonic():
+        return True
+
+    if not secrets.compare_digest(api_key.encode("utf-8"), _API_KEY_BYTES):
+        return False
+
+    # Only successful validations are cached, so this holds at most the
+    # configured key
+    _auth_cache[api_key] = time.monotonic() + _AUTH_TTL
+    return True
+
+
+class ApiKeyMiddleware:
+    """
+    ASGI middleware enforcing the X-API-Key header on /v1 endpoints.
+
+    Runs once per request before routing, so endpoints carry no per-route
+    auth dependency. /health and the OpenAPI docs stay public. Only
+    installed when an API key is configured.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"].startswith("/v1/")
+            and not _is_valid_api_key(Headers(scope=scope).get("x-api-key"))
+        ):
+            logger.warning("Authentication failed: invalid or missing API key")
+            response = ORJSONResponse(
+                {"detail": "Invalid or missing API key"},
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                headers={"WWW-Authenticate": "ApiKey"},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class JsonGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves snapshot responses alone.
+
+    JSON status and capability bodies shrink several-fold, but JPEG data
+    does not compress, so snapshots bypass it instead of burning CPU on the
+    Pi. Server-sent event streams are already skipped by Starlette.
+
+    A compressed body is a different representation from the identity one,
+    so its strong ETag gets a "-gz" suffix (see _gzip_etag). A 304 for a
+    client revalidating the gzip variant carries that ETag too.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/v1/camera/snapshot":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+
+        async def send_with_gzip_etag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                etag = headers.get("etag")
+                if etag is not None and (
+                    headers.get("content-encoding") == "gzip"
+                    or (
+                        message["status"] == status.HTTP_304_NOT_MODIFIED
+                        and "gzip" in request_headers.get("accept-encoding", "")
+                        and _gzip_etag(etag) in request_headers.get("if-none-match", "")
+                    )
+                ):
+                    headers["etag"] = _gzip_etag(etag)
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_gzip_etag)
 
 
 # Dependency injection functions
-def get_camera_controller() -> CameraController:
+async def get_camera_controller() -> CameraController:
     """
     Dependency injection for camera controller.
 
@@ -88,14 +231,11 @@ def get_camera_controller() -> CameraController:
         HTTPException: If camera is not initialized
     """
     if camera_controller is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Camera not initialized",
-        )
+        raise _HTTP_503_CAMERA.with_traceback(None)
     return camera_controller
 
 
-def get_streaming_manager() -> StreamingManager:
+async def get_streaming_manager() -> StreamingManager:
     """
     Dependency injection for streaming manager.
 
@@ -106,31 +246,143 @@ def get_streaming_manager() -> StreamingManager:
         HTTPException: If streaming manager is not initialized
     """
     if streaming_manager is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Streaming manager not initialized",
-        )
+        raise _HTTP_503_STREAMING.with_traceback(None)
     return streaming_manager
 
 
-def get_system_monitor() -> SystemMonitor:
+async def get_services() -> tuple[CameraController, StreamingManager]:
     """
-    Dependency injection for system monitor.
+    Dependency injection for endpoints that need both camera and streaming.
+
+    Resolves both globals in one dependency call instead of two.
 
     Returns:
-        SystemMonitor: The global system monitor instance
+        tuple: The global camera controller and streaming manager
 
     Raises:
-        HTTPException: If system monitor is not initialized
+        HTTPException: If either is not initialized
+    """
+    if camera_controller is None:
+        raise _HTTP_503_CAMERA.with_traceback(None)
+    if streaming_manager is None:
+        raise _HTTP_503_STREAMING.with_traceback(None)
+    return camera_controller, streaming_manager
+
+
+async def get_system_monitor() -> SystemMonitor:
+    """
+    Dependency injection for system monitor.
+
+    The monitor is created on first use rather than at startup, since
+    system metrics are rarely needed immediately.
+
+    Returns:
+        SystemMonitor: The global system monitor instance
     """
+    global system_monitor
     if system_monitor is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="System monitor not initialized",
-        )
+        with _system_monitor_lock:
+            if system_monitor is None:
+                system_monitor = SystemMonitor(start_time=_service_start_time)
+                logger.info("System monitor initialized")
     return system_monitor
 
 
+async def _run_camera_call(func: Callable[..., Any], /, *args, **kwargs) -> Any:
+    """
+    Run a blocking camera call in the threadpool once no reconfiguration is running.
+
+    Requests that arrive during a resolution/framerate change wait on the
+    asyncio lock instead of parking a worker thread on the controller's lock
+    for the whole stop/configure/start cycle. Must not be called while
+    holding _reconfiguration_lock.
+    """
+    if _reconfiguration_lock.locked():
+        async with _reconfiguration_lock:
+            pass
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+def _etag(body: bytes) -> str:
+    """Return a strong ETag for a serialized response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _gzip_etag(etag: str) -> str:
+    """Return the ETag of the gzip-encoded variant of a response."""
+    return etag[:-1] + '-gz"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header lists etag.
+
+    Uses weak comparison as If-None-Match requires: a W/ prefix is ignored,
+    and the "-gz" ETag of the compressed variant also matches, since both
+    encodings carry the same content.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or _gzip_etag(etag) in tags
+
+
+def _get_capabilities_payload(camera: CameraController) -> tuple[bytes, str]:
+    """Return the cached (JSON body, ETag) for capabilities, building it if needed."""
+    global _capabilities_cache
+    if _capabilities_cache is None:
+        body = orjson.dumps(
+            CameraCapabilitiesResponse(**camera.get_capabilities()).model_dump()
+        )
+        _capabilities_cache = (body, _etag(body))
+    return _capabilities_cache
+
+
+def _invalidate_capabilities() -> None:
+    """Drop the cached capabilities after the camera was reconfigured."""
+    global _capabilities_cache
+    _capabilities_cache = None
+
+
+def _start_logging() -> None:
+    """Route root logging through the queue and start the writer thread."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    formatter = logging.Formatter(_LOG_FORMAT)
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if CONFIG.log_file:
+        handlers.append(logging.FileHandler(CONFIG.log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    # Handlers (including any file I/O) run on the listener thread only
+    _log_listener = QueueListener(_log_queue, *handlers)
+
+    root = logging.getLogger()
+    root.setLevel(CONFIG.log_level)
+    root.addHandler(_log_handler)
+    _log_listener.start()
+
+    # Flush pending records even if startup fails before shutdown runs
+    atexit.register(_stop_logging)
+
+
+def _stop_logging() -> None:
+    """Flush queued records and detach the queue handler."""
+    global _log_listener
+    if _log_listener is None:
+        return
+
+    logging.getLogger().removeHandler(_log_handler)
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+    atexit.unregister(_stop_logging)
+
+
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -139,36 +391,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Initializes camera and streaming on startup, cleans up on shutdown.
     """
-    global camera_controller, streaming_manager, system_monitor
+    global camera_controller, streaming_manager
 
+    _start_logging()
     logger.info("=== Pi Camera Service Starting ===")
-    logger.info(f"Configuration: {CONFIG.width}x{CONFIG.height}@{CONFIG.framerate}fps")
-    logger.info(f"RTSP URL: {CONFIG.rtsp_url}")
-    logger.info(f"API Key Auth: {'Enabled' if CONFIG.api_key else 'Disabled'}")
+    logger.info("Configuration: %dx%d@%sfps", CONFIG.width, CONFIG.height, CONFIG.framerate)
+    logger.info("RTSP URL: %s", CONFIG.rtsp_url)
+    logger.info("API Key Auth: %s", "Enabled" if CONFIG.api_key else "Disabled")
+
+    # Endpoints offload blocking camera calls to the anyio worker pool;
+    # raise its default 40-token cap so slow captures cannot starve it
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
 
     try:
         # Initialize camera controller
         camera_controller = CameraController()
         camera_controller.configure()
+        _get_capabilities_payload(camera_controller)
 
         # Initialize streaming manager
         streaming_manager = StreamingManager(camera_controller)
 
-        # Initialize system monitor
-        system_monitor = SystemMonitor()
-        logger.info("System monitor initialized")
         streaming_manager.start()
 
         logger.info("=== Pi Camera Service Started Successfully ===")
 
     except CameraNotAvailableError as e:
-        logger.error(f"Camera not available: {e}")
+        logger.error("Camera not available: %s", e)
         raise
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to start camera service: {e}")
+        logger.error("Failed to start camera service: %s", e)
         raise
 
     yield
@@ -180,15 +435,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         try:
             streaming_manager.stop()
         except Exception as e:
-            logger.error(f"Error stopping streaming: {e}")
+            logger.error("Error stopping streaming: %s", e)
 
     if camera_controller is not None:
         try:
             camera_controller.cleanup()
         except Exception as e:
-            logger.error(f"Error cleaning up camera: {e}")
+            logger.error("Error cleaning up camera: %s", e)
 
     logger.info("=== Pi Camera Service Shutdown Complete ===")
+    _stop_logging()
 
 
 # Create FastAPI app
@@ -197,43 +453,91 @@ app = FastAPI(
     description="API for controlling Raspberry Pi camera and streaming to MediaMTX via RTSP",
     version="2.8.1",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+# Header name and OpenAPI security scheme enforced by ApiKeyMiddleware
+_API_KEY_SCHEME = {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+
+
+def _openapi() -> dict[str, Any]:
+    """
+    Build the OpenAPI schema with the X-API-Key scheme declared.
+
+    Auth is enforced by ApiKeyMiddleware rather than a per-route Security
+    dependency, so FastAPI does not see it; the scheme and a security
+    requirement on every /v1 operation are added here instead, which keeps
+    "Authorize" working in /docs.
+    """
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {})["securitySchemes"] = {
+            "APIKeyHeader": _API_KEY_SCHEME,
+        }
+        for path, operations in schema["paths"].items():
+            if path.startswith("/v1/"):
+                for operation in operations.values():
+                    operation["security"] = [{"APIKeyHeader": []}]
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+# With auth disabled the middleware is left out of the stack entirely
+if _API_KEY_BYTES is not None:
+    app.add_middleware(ApiKeyMiddleware)
+# Compress JSON for clients that accept gzip; a moderate level keeps CPU low
+app.add_middleware(JsonGZipMiddleware, minimum_size=256, compresslevel=5)
+
+
 # ========== Pydantic Models ==========
 
-class StatusResponse(BaseModel):
+class _RequestModel(BaseModel):
+    """Base for request bodies: unknown fields are rejected, instances are immutable."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class _ResponseModel(BaseModel):
+    """Base for response bodies: unknown fields are dropped."""
+    model_config = ConfigDict(extra="ignore")
+
+
+class StatusResponse(_ResponseModel):
     """Base response model with status."""
     status: str = "ok"
 
 
-class ManualExposureRequest(BaseModel):
+# Serialized plain StatusResponse for handlers that only acknowledge success.
+# Each request still gets its own Response object; only the bytes are shared.
+_OK_BODY = orjson.dumps(StatusResponse().model_dump())
+
+
+class ManualExposureRequest(_RequestModel):
     """Request model for manual exposure settings."""
-    exposure_us: int = Field(
-        ...,
+    exposure_us: Annotated[int, Field(
         gt=0,
         le=MAX_EXPOSURE_US,
         description=f"Exposure time in microseconds (100-{MAX_EXPOSURE_US})",
-    )
-    gain: float = Field(
-        1.0,
+    )]
+    gain: Annotated[float, Field(
         gt=0.0,
         le=MAX_GAIN,
         description=f"Analogue gain (1.0-{MAX_GAIN})",
-    )
+    )] = 1.0
 
 
-class AutoExposureRequest(BaseModel):
+class AutoExposureRequest(_RequestModel):
     """Request model for auto exposure toggle."""
-    enabled: bool = Field(..., description="Enable or disable auto exposure")
+    enabled: Annotated[bool, Field(description="Enable or disable auto exposure")]
 
 
-class AwbRequest(BaseModel):
+class AwbRequest(_RequestModel):
     """Request model for AWB toggle."""
-    enabled: bool = Field(..., description="Enable or disable auto white balance")
+    enabled: Annotated[bool, Field(description="Enable or disable auto white balance")]
 
 
-class CameraStatusResponse(BaseModel):
+class CameraStatusResponse(_ResponseModel):
     """Camera status response model with comprehensive metadata."""
     # Existing fields
     lux: float | None = Field(None, description="Estimated scene brightness (lux)")
@@ -275,7 +579,21 @@ class CameraStatusResponse(BaseModel):
     ae_exposure_mode: str | None = Field(None, description="Current AE exposure mode")
 
 
-class CameraCapabilitiesResponse(BaseModel):
+class FrameMetadataEntry(_ResponseModel):
+    """Exposure metadata of one recently completed frame."""
+    age_s: float = Field(..., description="Seconds since the frame completed")
+    lux: float | None = Field(None, description="Estimated scene brightness (lux)")
+    exposure_us: int | None = Field(None, description="Exposure time (µs)")
+    analogue_gain: float | None = Field(None, description="Analogue gain")
+    colour_temperature: float | None = Field(None, description="Color temperature (K)")
+
+
+class StatusHistoryResponse(_ResponseModel):
+    """Recent frame metadata response model, oldest frame first."""
+    frames: list[FrameMetadataEntry] = Field(..., description="Recently completed frames, oldest first")
+
+
+class CameraCapabilitiesResponse(_ResponseModel):
     """Camera capabilities response model with hardware limits and features."""
     sensor_model: str = Field(..., description="Camera sensor model name")
     sensor_resolution: dict = Field(..., description="Native sensor resolution")
@@ -320,7 +638,22 @@ class StreamingResponse(StatusResponse):
     streaming: bool = Field(..., description="Streaming state")
 
 
-class HealthResponse(BaseModel):
+# Bodies for responses that only carry a single flag, serialized once per value
+_AUTO_EXPOSURE_BODIES = {
+    enabled: orjson.dumps(AutoExposureResponse(auto_exposure=enabled).model_dump())
+    for enabled in (True, False)
+}
+_AWB_BODIES = {
+    enabled: orjson.dumps(AwbResponse(awb_enabled=enabled).model_dump())
+    for enabled in (True, False)
+}
+_STREAMING_BODIES = {
+    active: orjson.dumps(StreamingResponse(streaming=active).model_dump())
+    for active in (True, False)
+}
+
+
+class HealthResponse(_ResponseModel):
     """Health check response model."""
     status: str = Field(..., description="Service health status")
     camera_configured: bool = Field(..., description="Camera is configured")
@@ -328,24 +661,46 @@ class HealthResponse(BaseModel):
     version: str = Field(..., description="API version")
 
 
+def _health_payload(ready: bool, configured: bool, active: bool) -> tuple[bytes, str]:
+    """Serialize one health state, returning (JSON body, ETag)."""
+    body = orjson.dumps(
+        HealthResponse(
+            status="healthy" if ready else "initializing",
+            camera_configured=configured,
+            streaming_active=active,
+            version="2.8.1",
+        ).model_dump()
+    )
+    return body, _etag(body)
+
+
+# Health (body, ETag) keyed by (camera ready, camera configured, streaming active)
+_HEALTH_BODIES = {
+    (ready, configured, active): _health_payload(ready, configured, active)
+    for ready in (True, False)
+    for configured in (True, False)
+    for active in (True, False)
+}
+
+
 # ========== New v2.0 Models ==========
 
-class AutofocusModeRequest(BaseModel):
+class AutofocusModeRequest(_RequestModel):
     """Request model for autofocus mode."""
     mode: str = Field(..., description="Autofocus mode: default, manual, auto, continuous")
 
 
-class LensPositionRequest(BaseModel):
+class LensPositionRequest(_RequestModel):
     """Request model for manual lens position."""
     position: float = Field(..., ge=0.0, le=15.0, description="Lens position (0.0=infinity, higher=closer)")
 
 
-class AutofocusRangeRequest(BaseModel):
+class AutofocusRangeRequest(_RequestModel):
     """Request model for autofocus range."""
     range_mode: str = Field(..., description="Autofocus range: normal, macro, full")
 
 
-class SnapshotRequest(BaseModel):
+class SnapshotRequest(_RequestModel):
     """Request model for snapshot capture."""
     width: int = Field(1920, ge=320, le=4608, description="Image width in pixels")
     height: int = Field(1080, ge=240, le=2592, description="Image height in pixels")
@@ -359,18 +714,18 @@ class SnapshotResponse(StatusResponse):
     height: int = Field(..., description="Image height")
 
 
-class ManualAwbRequest(BaseModel):
+class ManualAwbRequest(_RequestModel):
     """Request model for manual white balance."""
     red_gain: float = Field(..., ge=0.5, le=5.0, description="Red channel gain")
     blue_gain: float = Field(..., ge=0.5, le=5.0, description="Blue channel gain")
 
 
-class AwbPresetRequest(BaseModel):
+class AwbPresetRequest(_RequestModel):
     """Request model for AWB preset."""
     preset: str = Field(..., description="AWB preset: daylight_noir, ir_850nm, ir_940nm, indoor_noir")
 
 
-class ImageProcessingRequest(BaseModel):
+class ImageProcessingRequest(_RequestModel):
     """Request model for image processing parameters."""
     brightness: float | None = Field(None, ge=-1.0, le=1.0, description="Brightness (-1.0 to 1.0)")
     contrast: float | None = Field(None, ge=0.0, le=2.0, description="Contrast (0.0 to 2.0)")
@@ -378,12 +733,12 @@ class ImageProcessingRequest(BaseModel):
     sharpness: float | None = Field(None, ge=0.0, le=16.0, description="Sharpness (0.0 to 16.0)")
 
 
-class HdrModeRequest(BaseModel):
+class HdrModeRequest(_RequestModel):
     """Request model for HDR mode."""
     mode: str = Field(..., description="HDR mode: off, auto, sensor, single-exp")
 
 
-class RoiRequest(BaseModel):
+class RoiRequest(_RequestModel):
     """Request model for Region of Interest."""
     x: float = Field(..., ge=0.0, le=1.0, description="X offset (normalized 0.0-1.0)")
     y: float = Field(..., ge=0.0, le=1.0, description="Y offset (normalized 0.0-1.0)")
@@ -391,7 +746,7 @@ class RoiRequest(BaseModel):
     height: float = Field(..., gt=0.0, le=1.0, description="Height (normalized 0.0-1.0)")
 
 
-class ExposureLimitsRequest(BaseModel):
+class ExposureLimitsRequest(_RequestModel):
     """Request model for exposure limits."""
     min_exposure_us: int | None = Field(None, ge=100, le=1_000_000, description="Min exposure (µs)")
     max_exposure_us: int | None = Field(None, ge=100, le=1_000_000, description="Max exposure (µs)")
@@ -399,19 +754,19 @@ class ExposureLimitsRequest(BaseModel):
     max_gain: float | None = Field(None, ge=1.0, le=16.0, description="Max gain")
 
 
-class LensCorrectionRequest(BaseModel):
+class LensCorrectionRequest(_RequestModel):
     """Request model for lens correction."""
     enabled: bool = Field(..., description="Enable lens shading correction")
 
 
-class TransformRequest(BaseModel):
+class TransformRequest(_RequestModel):
     """Request model for image transform."""
     hflip: bool = Field(False, description="Horizontal flip")
     vflip: bool = Field(False, description="Vertical flip")
     rotation: int = Field(0, description="Rotation in degrees (0 or 180)")
 
 
-class DayNightModeRequest(BaseModel):
+class DayNightModeRequest(_RequestModel):
     """Request model for day/night mode."""
     mode: str = Field(..., description="Day/night mode: manual, auto")
     threshold_lux: float = Field(10.0, ge=0.0, description="Lux threshold for day/night detection")
@@ -419,32 +774,32 @@ class DayNightModeRequest(BaseModel):
 
 # ========== New v2.1 Models ==========
 
-class ExposureValueRequest(BaseModel):
+class ExposureValueRequest(_RequestModel):
     """Request model for exposure value (EV) compensation."""
     ev: float = Field(..., ge=-8.0, le=8.0, description="EV compensation (-8.0 to +8.0)")
 
 
-class NoiseReductionRequest(BaseModel):
+class NoiseReductionRequest(_RequestModel):
     """Request model for noise reduction mode."""
     mode: str = Field(..., description="Noise reduction mode: off, fast, high_quality, minimal, zsl")
 
 
-class AeConstraintModeRequest(BaseModel):
+class AeConstraintModeRequest(_RequestModel):
     """Request model for AE constraint mode."""
     mode: str = Field(..., description="AE constraint mode: normal, highlight, shadows, custom")
 
 
-class AeExposureModeRequest(BaseModel):
+class AeExposureModeRequest(_RequestModel):
     """Request model for AE exposure mode."""
     mode: str = Field(..., description="AE exposure mode: normal, short, long, custom")
 
 
-class AwbModeRequest(BaseModel):
+class AwbModeRequest(_RequestModel):
     """Request model for AWB mode."""
     mode: str = Field(..., description="AWB mode: auto, tungsten, fluorescent, indoor, daylight, cloudy, custom")
 
 
-class ResolutionRequest(BaseModel):
+class ResolutionRequest(_RequestModel):
     """Request model for resolution change."""
     width: int = Field(..., ge=64, le=4096, description="Video width in pixels")
     height: int = Field(..., ge=64, le=4096, description="Video height in pixels")
@@ -452,24 +807,37 @@ class ResolutionRequest(BaseModel):
     fov_mode: Optional[str] = Field(None, description="FOV mode: 'scale' (constant FOV) or 'crop' (zoom)")
 
 
-class FramerateRequest(BaseModel):
+class FramerateRequest(_RequestModel):
     """Request model for framerate change."""
     framerate: float = Field(..., gt=0, le=1000, description="Desired framerate in fps")
     restart_streaming: bool = Field(True, description="Restart streaming after framerate change")
 
 
-class FovModeRequest(BaseModel):
+class FovModeRequest(_RequestModel):
     """Request model for FOV mode change."""
     mode: str = Field(..., description="FOV mode: 'scale' (constant FOV) or 'crop' (zoom)")
 
 
-class FovModeResponse(BaseModel):
+class FovModeResponse(_ResponseModel):
     """Response model for FOV mode."""
     mode: str = Field(..., description="Current FOV mode")
     description: str = Field(..., description="Description of the current mode")
 
 
-class FramerateResponse(BaseModel):
+# Description reported alongside each FOV mode
+_FOV_DESC = {
+    "scale": "Full sensor readout with downscaling → Constant field of view",
+    "crop": "Sensor crop → Digital zoom effect (FOV reduces at lower resolutions)",
+}
+
+# Serialized FovModeResponse for each mode
+_FOV_BODIES = {
+    mode: orjson.dumps(FovModeResponse(mode=mode, description=description).model_dump())
+    for mode, description in _FOV_DESC.items()
+}
+
+
+class FramerateResponse(_ResponseModel):
     """Response model for framerate change."""
     status: str = "ok"
     requested_framerate: float = Field(..., description="Requested framerate")
@@ -479,9 +847,33 @@ class FramerateResponse(BaseModel):
     clamped: bool = Field(..., description="Whether the framerate was clamped to maximum")
 
 
+class BatchItem(_RequestModel):
+    """A single control operation within a batch request."""
+    op: str = Field(..., description="Operation name, e.g. 'awb_preset', 'exposure_value' or 'resolution'")
+    params: dict[str, Any] = Field(default_factory=dict, description="Request body the operation's endpoint accepts")
+
+
+class BatchRequest(_RequestModel):
+    """Request model for batched control commands."""
+    items: list[BatchItem] = Field(..., min_length=1, max_length=32, description="Operations, applied in order")
+    restart_streaming: bool = Field(True, description="Restart streaming after a resolution/framerate change")
+
+
+class BatchItemResult(_ResponseModel):
+    """Outcome of a single batched operation."""
+    op: str = Field(..., description="Operation name")
+    ok: bool = Field(..., description="Whether the operation was applied")
+    error: Optional[str] = Field(None, description="Error message if the operation failed")
+
+
+class BatchResponse(StatusResponse):
+    """Response model for batch endpoint."""
+    results: list[BatchItemResult] = Field(..., description="Per-operation results, in request order")
+
+
 # ========== New v2.5 Models ==========
 
-class SystemStatusResponse(BaseModel):
+class SystemStatusResponse(_ResponseModel):
     """System status response model."""
     temperature: Optional[dict] = Field(None, description="CPU temperature info")
     cpu: Optional[dict] = Field(None, description="CPU usage and load average")
@@ -492,7 +884,7 @@ class SystemStatusResponse(BaseModel):
     throttled: Optional[dict] = Field(None, description="Throttling status (Pi-specific)")
 
 
-class LogsResponse(BaseModel):
+class LogsResponse(_ResponseModel):
     """Logs response model."""
     logs: list[str] = Field(..., description="Log lines")
     total_lines: int = Field(..., description="Total number of lines returned")
@@ -501,77 +893,147 @@ class LogsResponse(BaseModel):
 
 # ========== Exception Handlers ==========
 
-@app.exception_handler(InvalidParameterError)
-async def invalid_parameter_handler(request, exc: InvalidParameterError):
-    """Handle invalid parameter errors."""
-    logger.warning(f"Invalid parameter: {exc}")
-    return HTTPException(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        detail=str(exc),
-    )
+# Status code and client-facing detail for each camera exception type.
+# A detail of None means the exception message is passed through.
+_EXC_MAP: dict[type[CameraError], tuple[int, str | None]] = {
+    InvalidParameterError: (status.HTTP_422_UNPROCESSABLE_CONTENT, None),
+    CameraNotAvailableError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Camera is not available"),
+    StreamingError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "Streaming operation failed"),
+    CameraError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "Camera operation failed"),
+}
 
+# Serialized bodies for the fixed-detail entries above
+_EXC_BODIES: dict[type[CameraError], bytes] = {
+    cls: orjson.dumps({"detail": detail})
+    for cls, (_, detail) in _EXC_MAP.items()
+    if detail is not None
+}
 
-@app.exception_handler(CameraNotAvailableError)
-async def camera_not_available_handler(request, exc: CameraNotAvailableError):
-    """Handle camera not available errors."""
-    logger.error(f"Camera not available: {exc}")
-    return HTTPException(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        detail="Camera is not available",
+
+@app.exception_handler(CameraError)
+async def camera_error_handler(request, exc: CameraError) -> Response:
+    """Translate camera exceptions into JSON error responses."""
+    for cls in type(exc).__mro__:
+        entry = _EXC_MAP.get(cls)
+        if entry is not None:
+            break
+    status_code, detail = entry
+
+    if detail is None:
+        logger.warning("Invalid parameter: %s", exc)
+        return ORJSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+    logger.error("%s: %s", type(exc).__name__, exc)
+    return Response(
+        content=_EXC_BODIES[cls],
+        status_code=status_code,
+        media_type="application/json",
     )
 
 
-@app.exception_handler(StreamingError)
-async def streaming_error_handler(request, exc: StreamingError):
-    """Handle streaming errors."""
-    logger.error(f"Streaming error: {exc}")
-    return HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Streaming operation failed",
-    )
+# Control endpoints registered via _control_endpoint: path -> (action, request model).
+_CONTROL_ENDPOINTS: dict[str, tuple[Callable[..., None], type[BaseModel] | None]] = {}
 
 
-@app.exception_handler(CameraError)
-async def camera_error_handler(request, exc: CameraError):
-    """Handle general camera errors."""
-    logger.error(f"Camera error: {exc}")
-    return HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Camera operation failed",
-    )
+def _control_endpoint(path: str, *, tags: list[str], error_detail: str):
+    """
+    Register a camera control action as a POST endpoint.
+
+    The decorated action takes the validated request model as ``req``
+    (if any) and the controller as ``camera``. One generic handler is
+    generated per action: it resolves the controller through
+    Depends(get_camera_controller) like every other route, runs the action
+    in the threadpool, and turns unexpected failures into a 500 with
+    ``error_detail``. The action's docstring becomes the endpoint
+    description and the action itself is returned unchanged.
+    """
+    def decorator(action: Callable[..., None]) -> Callable[..., None]:
+        hints = get_type_hints(action)
+        request_model = hints.get("req")
+
+        parameters = []
+        for name in inspect.signature(action).parameters:
+            if name == "camera":
+                annotation = Annotated[CameraController, Depends(get_camera_controller)]
+            else:
+                annotation = hints[name]
+            parameters.append(
+                inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            )
+
+        http_error = _http_500(error_detail)
+
+        async def handler(**kwargs) -> Response:
+            try:
+                await _run_camera_call(action, **kwargs)
+            except (CameraNotAvailableError, InvalidParameterError):
+                raise
+            except Exception as e:
+                logger.error("%s: %s", error_detail, e)
+                raise http_error.with_traceback(None)
+            return Response(content=_OK_BODY, media_type="application/json")
+
+        handler.__name__ = action.__name__
+        handler.__qualname__ = action.__qualname__
+        handler.__doc__ = action.__doc__
+        handler.__signature__ = inspect.Signature(parameters)
+
+        app.post(
+            path,
+            response_model=None,
+            responses={200: {"model": StatusResponse}},
+            tags=tags,
+        )(handler)
+        _CONTROL_ENDPOINTS[path] = (action, request_model)
+        return action
+
+    return decorator
 
 
 # ========== API Endpoints ==========
 
-@app.get("/health", response_model=HealthResponse, tags=["System"])
-def health_check() -> HealthResponse:
+@app.get(
+    "/health",
+    response_model=None,
+    responses={200: {"model": HealthResponse}},
+    tags=["System"],
+)
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint for monitoring.
 
     Returns service health status, camera configuration state,
     and streaming status. Does not require authentication.
 
+    Probed frequently by monitoring, so the body is picked from the
+    pre-serialized _HEALTH_BODIES instead of being built per request. The
+    response carries an ETag and Cache-Control: max-age=1; a matching
+    If-None-Match gets an empty 304 Not Modified.
+
     Returns:
-        HealthResponse: Service health information
+        Response: Service health information (HealthResponse) as JSON
     """
-    return HealthResponse(
-        status="healthy" if camera_controller is not None else "initializing",
-        camera_configured=camera_controller._configured if camera_controller else False,
-        streaming_active=streaming_manager.is_streaming() if streaming_manager else False,
-        version="2.8.1",
+    state = (
+        camera_controller is not None,
+        camera_controller._configured if camera_controller else False,
+        streaming_manager.is_streaming() if streaming_manager else False,
     )
+    body, etag = _HEALTH_BODIES[state]
+    headers = {"ETag": etag, "Cache-Control": "max-age=1"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get(
     "/v1/camera/status",
-    response_model=CameraStatusResponse,
+    response_model=None,
+    responses={200: {"model": CameraStatusResponse}},
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def get_camera_status(
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-    streaming: Annotated[StreamingManager, Depends(get_streaming_manager)],
-) -> CameraStatusResponse:
+async def get_camera_status(
+    services: Annotated[tuple[CameraController, StreamingManager], Depends(get_services)],
+) -> ORJSONResponse:
     """
     Get current camera status and metadata.
 
@@ -584,69 +1046,74 @@ def get_camera_status(
     Raises:
         HTTPException: If camera is not configured or operation fails
     """
+    camera, streaming = services
     logger.debug("Getting camera status")
 
     try:
-        status_data = camera.get_status()
-        return CameraStatusResponse(
-            # Existing v1.0 fields
-            lux=status_data.get("lux"),
-            exposure_us=status_data.get("exposure_us"),
-            analogue_gain=status_data.get("analogue_gain"),
-            colour_temperature=status_data.get("colour_temperature"),
-            auto_exposure=status_data.get("auto_exposure", False),
-            streaming=streaming.is_streaming(),
-
-            # New v2.0 fields
-            autofocus_mode=status_data.get("autofocus_mode"),
-            lens_position=status_data.get("lens_position"),
-            focus_fom=status_data.get("focus_fom"),
-            hdr_mode=status_data.get("hdr_mode"),
-            lens_correction_enabled=status_data.get("lens_correction_enabled"),
-            scene_mode=status_data.get("scene_mode"),
-            day_night_mode=status_data.get("day_night_mode"),
-            day_night_threshold_lux=status_data.get("day_night_threshold_lux"),
-            frame_duration_us=status_data.get("frame_duration_us"),
-            sensor_black_levels=status_data.get("sensor_black_levels"),
-            fov_mode=status_data.get("fov_mode"),
-
-            # Bitrate configuration (v2.6.1)
-            bitrate_bps=status_data.get("bitrate_bps"),
-            bitrate_mbps=status_data.get("bitrate_mbps"),
-
-            # Camera type and sensor mode (v2.7.0)
-            is_wide_camera=status_data.get("is_wide_camera"),
-            sensor_mode_width=status_data.get("sensor_mode_width"),
-            sensor_mode_height=status_data.get("sensor_mode_height"),
-
-            # Current limits (v2.2)
-            current_limits=status_data.get("current_limits"),
-
-            # Advanced controls (v2.1) - current values
-            exposure_value=status_data.get("exposure_value"),
-            noise_reduction_mode=status_data.get("noise_reduction_mode"),
-            ae_constraint_mode=status_data.get("ae_constraint_mode"),
-            ae_exposure_mode=status_data.get("ae_exposure_mode"),
+        # Not cached: get_status() reads the metadata kept by the frame
+        # callback, and has to reflect control changes made just before
+        status_data = await _run_camera_call(camera.get_status)
+        # get_status() keys match the model fields and come from the camera
+        # layer, so the model is built without re-validating each field and
+        # dumped directly rather than through jsonable_encoder
+        return ORJSONResponse(
+            CameraStatusResponse.model_construct(
+                streaming=streaming.is_streaming(),
+                **status_data,
+            ).model_dump()
         )
     except CameraNotAvailableError:
         raise
     except Exception as e:
-        logger.error(f"Error getting camera status: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve camera status",
-        )
+        logger.error("Error getting camera status: %s", e)
+        raise _HTTP_500_STATUS.with_traceback(None)
+
+
+@app.get(
+    "/v1/camera/status/history",
+    response_model=None,
+    responses={200: {"model": StatusHistoryResponse}},
+    tags=["Camera"],
+)
+async def get_camera_status_history(
+    camera: Annotated[CameraController, Depends(get_camera_controller)],
+) -> ORJSONResponse:
+    """
+    Get exposure metadata of the most recently completed frames.
+
+    Lets a host-side exposure loop average lux, exposure and gain over
+    several frames with one request instead of polling /v1/camera/status
+    at the frame rate. The list is empty until the first frame completes.
+
+    Returns:
+        StatusHistoryResponse: Up to METADATA_HISTORY_SIZE frames, oldest first
+    """
+    # A copy of the bounded deque kept by the frame callback; no camera
+    # access, so it runs inline rather than in the threadpool
+    history = camera.get_status_history()
+    now = time.monotonic()
+    frames = [
+        {
+            "age_s": round(now - timestamp, 4),
+            "lux": meta.get("Lux"),
+            "exposure_us": meta.get("ExposureTime"),
+            "analogue_gain": meta.get("AnalogueGain"),
+            "colour_temperature": meta.get("ColourTemperature"),
+        }
+        for timestamp, meta in history
+    ]
+    return ORJSONResponse({"frames": frames})
 
 
 @app.get(
     "/v1/camera/capabilities",
     response_model=CameraCapabilitiesResponse,
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def get_camera_capabilities(
+async def get_camera_capabilities(
+    request: Request,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> CameraCapabilitiesResponse:
+) -> Response:
     """
     Get camera hardware capabilities and supported features.
 
@@ -656,8 +1123,11 @@ def get_camera_capabilities(
     This endpoint provides static capabilities information (what the hardware can do),
     while /v1/camera/status provides dynamic runtime information (current state and limits).
 
+    The response carries an ETag; send it back in If-None-Match to get an
+    empty 304 Not Modified while the capabilities are unchanged.
+
     Returns:
-        CameraCapabilitiesResponse: Camera capabilities
+        Response: Camera capabilities (CameraCapabilitiesResponse) as JSON
 
     Raises:
         HTTPException: If camera is not configured or operation fails
@@ -665,28 +1135,31 @@ def get_camera_capabilities(
     logger.debug("Getting camera capabilities")
 
     try:
-        capabilities = camera.get_capabilities()
-        return CameraCapabilitiesResponse(**capabilities)
+        payload = _capabilities_cache
+        if payload is None:
+            payload = await _run_camera_call(_get_capabilities_payload, camera)
+        body, etag = payload
+
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except CameraNotAvailableError:
         raise
     except Exception as e:
-        logger.error(f"Error getting camera capabilities: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve camera capabilities",
-        )
+        logger.error("Error getting camera capabilities: %s", e)
+        raise _HTTP_500_CAPABILITIES.with_traceback(None)
 
 
 @app.post(
     "/v1/camera/auto_exposure",
-    response_model=AutoExposureResponse,
+    response_model=None,
+    responses={200: {"model": AutoExposureResponse}},
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def set_auto_exposure(
+async def set_auto_exposure(
     req: AutoExposureRequest,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> AutoExposureResponse:
+) -> Response:
     """
     Enable or disable automatic exposure control.
 
@@ -702,31 +1175,28 @@ def set_auto_exposure(
     Raises:
         HTTPException: If camera is not configured or operation fails
     """
-    logger.info(f"Setting auto exposure: {req.enabled}")
+    logger.info("Setting auto exposure: %s", req.enabled)
 
     try:
-        camera.set_auto_exposure(req.enabled)
-        return AutoExposureResponse(auto_exposure=req.enabled)
+        await _run_camera_call(camera.set_auto_exposure, req.enabled)
+        return Response(content=_AUTO_EXPOSURE_BODIES[req.enabled], media_type="application/json")
     except CameraNotAvailableError:
         raise
     except Exception as e:
-        logger.error(f"Error setting auto exposure: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set auto exposure",
-        )
+        logger.error("Error setting auto exposure: %s", e)
+        raise _HTTP_500_AUTO_EXPOSURE.with_traceback(None)
 
 
 @app.post(
     "/v1/camera/manual_exposure",
-    response_model=ManualExposureResponse,
+    response_model=None,
+    responses={200: {"model": ManualExposureResponse}},
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def set_manual_exposure(
+async def set_manual_exposure(
     req: ManualExposureRequest,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> ManualExposureResponse:
+) -> ORJSONResponse:
     """
     Set manual exposure parameters.
 
@@ -742,42 +1212,38 @@ def set_manual_exposure(
     Raises:
         HTTPException: If parameters are invalid or operation fails
     """
-    logger.info(f"Setting manual exposure: {req.exposure_us}µs, gain={req.gain}")
+    logger.info("Setting manual exposure: %dµs, gain=%s", req.exposure_us, req.gain)
 
     try:
-        camera.set_manual_exposure(
-            exposure_us=req.exposure_us,
-            gain=req.gain,
-        )
-        return ManualExposureResponse(
+        await _run_camera_call(
+            camera.set_manual_exposure,
             exposure_us=req.exposure_us,
             gain=req.gain,
         )
-    except InvalidParameterError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
+        # Values were validated by ManualExposureRequest
+        return ORJSONResponse(
+            ManualExposureResponse.model_construct(
+                exposure_us=req.exposure_us,
+                gain=req.gain,
+            ).model_dump()
         )
-    except CameraNotAvailableError:
+    except (CameraNotAvailableError, InvalidParameterError):
         raise
     except Exception as e:
-        logger.error(f"Error setting manual exposure: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set manual exposure",
-        )
+        logger.error("Error setting manual exposure: %s", e)
+        raise _HTTP_500_MANUAL_EXPOSURE.with_traceback(None)
 
 
 @app.post(
     "/v1/camera/awb",
-    response_model=AwbResponse,
+    response_model=None,
+    responses={200: {"model": AwbResponse}},
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def set_awb(
+async def set_awb(
     req: AwbRequest,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> AwbResponse:
+) -> Response:
     """
     Enable or disable automatic white balance (AWB).
 
@@ -793,30 +1259,27 @@ def set_awb(
     Raises:
         HTTPException: If camera is not configured or operation fails
     """
-    logger.info(f"Setting AWB: {req.enabled}")
+    logger.info("Setting AWB: %s", req.enabled)
 
     try:
-        camera.set_awb(req.enabled)
-        return AwbResponse(awb_enabled=req.enabled)
+        await _run_camera_call(camera.set_awb, req.enabled)
+        return Response(content=_AWB_BODIES[req.enabled], media_type="application/json")
     except CameraNotAvailableError:
         raise
     except Exception as e:
-        logger.error(f"Error setting AWB: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set AWB",
-        )
+        logger.error("Error setting AWB: %s", e)
+        raise _HTTP_500_AWB.with_traceback(None)
 
 
 @app.post(
     "/v1/streaming/start",
-    response_model=StreamingResponse,
+    response_model=None,
+    responses={200: {"model": StreamingResponse}},
     tags=["Streaming"],
-    dependencies=[Depends(verify_api_key)],
 )
-def start_streaming(
+async def start_streaming(
     streaming: Annotated[StreamingManager, Depends(get_streaming_manager)],
-) -> StreamingResponse:
+) -> Response:
     """
     Start H.264 streaming to MediaMTX.
 
@@ -832,27 +1295,27 @@ def start_streaming(
     logger.info("Starting streaming (via API)")
 
     try:
-        streaming.start()
-        return StreamingResponse(streaming=streaming.is_streaming())
+        await run_in_threadpool(streaming.start)
+        return Response(
+            content=_STREAMING_BODIES[streaming.is_streaming()],
+            media_type="application/json",
+        )
     except StreamingError:
         raise
     except Exception as e:
-        logger.error(f"Error starting streaming: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to start streaming",
-        )
+        logger.error("Error starting streaming: %s", e)
+        raise _HTTP_500_STREAMING_START.with_traceback(None)
 
 
 @app.post(
     "/v1/streaming/stop",
-    response_model=StreamingResponse,
+    response_model=None,
+    responses={200: {"model": StreamingResponse}},
     tags=["Streaming"],
-    dependencies=[Depends(verify_api_key)],
 )
-def stop_streaming(
+async def stop_streaming(
     streaming: Annotated[StreamingManager, Depends(get_streaming_manager)],
-) -> StreamingResponse:
+) -> Response:
     """
     Stop H.264 streaming.
 
@@ -868,29 +1331,28 @@ def stop_streaming(
     logger.info("Stopping streaming (via API)")
 
     try:
-        streaming.stop()
-        return StreamingResponse(streaming=streaming.is_streaming())
-    except Exception as e:
-        logger.error(f"Error stopping streaming: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to stop streaming",
+        await run_in_threadpool(streaming.stop)
+        return Response(
+            content=_STREAMING_BODIES[streaming.is_streaming()],
+            media_type="application/json",
         )
+    except Exception as e:
+        logger.error("Error stopping streaming: %s", e)
+        raise _HTTP_500_STREAMING_STOP.with_traceback(None)
 
 
 # ========== New v2.0 Endpoints ==========
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/autofocus_mode",
-    response_model=StatusResponse,
     tags=["Camera - Autofocus"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set autofocus mode",
 )
 def set_autofocus_mode(
     req: AutofocusModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set autofocus mode.
 
@@ -901,38 +1363,20 @@ def set_autofocus_mode(
 
     Args:
         req: Autofocus mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting autofocus mode: {req.mode}")
-
-    try:
-        camera.set_autofocus_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting autofocus mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set autofocus mode",
-        )
+    logger.info("Setting autofocus mode: %s", req.mode)
+    camera.set_autofocus_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/lens_position",
-    response_model=StatusResponse,
     tags=["Camera - Autofocus"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set lens position",
 )
 def set_lens_position(
     req: LensPositionRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set manual lens position for focus.
 
@@ -943,38 +1387,20 @@ def set_lens_position(
 
     Args:
         req: Lens position request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting lens position: {req.position}")
-
-    try:
-        camera.set_lens_position(req.position)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting lens position: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set lens position",
-        )
+    logger.info("Setting lens position: %s", req.position)
+    camera.set_lens_position(req.position)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/autofocus_range",
-    response_model=StatusResponse,
     tags=["Camera - Autofocus"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set autofocus range",
 )
 def set_autofocus_range(
     req: AutofocusRangeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set autofocus search range.
 
@@ -985,86 +1411,96 @@ def set_autofocus_range(
 
     Args:
         req: Autofocus range request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting autofocus range: {req.range_mode}")
-
-    try:
-        camera.set_autofocus_range(req.range_mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting autofocus range: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set autofocus range",
-        )
+    logger.info("Setting autofocus range: %s", req.range_mode)
+    camera.set_autofocus_range(req.range_mode)
 
 
 @app.post(
     "/v1/camera/snapshot",
-    response_model=SnapshotResponse,
+    response_model=None,
+    responses={
+        200: {
+            "model": SnapshotResponse,
+            "content": {"image/jpeg": {}},
+            "description": "Raw JPEG image, or SnapshotResponse with ?encoding=base64",
+        }
+    },
     tags=["Camera - Capture"],
-    dependencies=[Depends(verify_api_key)],
 )
-def capture_snapshot(
+async def capture_snapshot(
     req: SnapshotRequest,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> SnapshotResponse:
+    encoding: Annotated[
+        Literal["jpeg", "base64"],
+        Query(description="Response encoding: raw JPEG bytes or legacy base64 JSON"),
+    ] = "jpeg",
+) -> Response:
     """
     Capture a single JPEG image without stopping streaming.
 
-    Optionally triggers autofocus before capture. Image is returned
-    as base64-encoded JPEG data.
+    Optionally triggers autofocus before capture. The image is returned
+    as raw image/jpeg bytes with X-Image-Width/X-Image-Height headers;
+    pass ?encoding=base64 to get the legacy JSON SnapshotResponse.
 
     Args:
         req: Snapshot request with resolution and autofocus settings
+        encoding: "jpeg" (default) or "base64"
 
     Returns:
-        SnapshotResponse: Base64-encoded JPEG image
+        Response: JPEG image, or SnapshotResponse for encoding=base64
 
     Raises:
         HTTPException: If capture fails
     """
-    logger.info(f"Capturing snapshot: {req.width}x{req.height}")
+    logger.info("Capturing snapshot: %sx%s", req.width, req.height)
+
+    # Only pay for base64 when a legacy client asks for it
+    capture = (
+        camera.capture_snapshot if encoding == "base64" else camera.capture_snapshot_bytes
+    )
 
     try:
-        image_base64 = camera.capture_snapshot(
+        image = await _run_camera_call(
+            capture,
             width=req.width,
             height=req.height,
             autofocus_trigger=req.autofocus_trigger,
         )
-        return SnapshotResponse(
-            image_base64=image_base64,
-            width=req.width,
-            height=req.height,
-        )
     except CameraNotAvailableError:
         raise
     except Exception as e:
-        logger.error(f"Error capturing snapshot: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to capture snapshot",
+        logger.error("Error capturing snapshot: %s", e)
+        raise _HTTP_500_SNAPSHOT.with_traceback(None)
+
+    if encoding == "base64":
+        return ORJSONResponse(
+            SnapshotResponse.model_construct(
+                image_base64=image,
+                width=req.width,
+                height=req.height,
+            ).model_dump()
         )
 
+    return Response(
+        content=image,
+        media_type="image/jpeg",
+        headers={
+            "X-Image-Width": str(req.width),
+            "X-Image-Height": str(req.height),
+        },
+    )
+
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/manual_awb",
-    response_model=StatusResponse,
     tags=["Camera - White Balance"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set manual AWB",
 )
 def set_manual_awb(
     req: ManualAwbRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set manual white balance gains.
 
@@ -1078,38 +1514,20 @@ def set_manual_awb(
 
     Args:
         req: Manual AWB request with red and blue gains
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
-    """
-    logger.info(f"Setting manual AWB: R={req.red_gain}, B={req.blue_gain}")
-
-    try:
-        camera.set_manual_awb(req.red_gain, req.blue_gain)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting manual AWB: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set manual AWB",
-        )
+    """
+    logger.info("Setting manual AWB: R=%s, B=%s", req.red_gain, req.blue_gain)
+    camera.set_manual_awb(req.red_gain, req.blue_gain)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/awb_preset",
-    response_model=StatusResponse,
     tags=["Camera - White Balance"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set AWB preset",
 )
 def set_awb_preset(
     req: AwbPresetRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set white balance using a NoIR-optimized preset.
 
@@ -1121,38 +1539,20 @@ def set_awb_preset(
 
     Args:
         req: AWB preset request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting AWB preset: {req.preset}")
-
-    try:
-        camera.set_awb_preset(req.preset)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting AWB preset: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set AWB preset",
-        )
+    logger.info("Setting AWB preset: %s", req.preset)
+    camera.set_awb_preset(req.preset)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/image_processing",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set image processing",
 )
 def set_image_processing(
     req: ImageProcessingRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set image processing parameters.
 
@@ -1161,43 +1561,26 @@ def set_image_processing(
 
     Args:
         req: Image processing request with optional parameters
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting image processing: {req}")
-
-    try:
-        camera.set_image_processing(
-            brightness=req.brightness,
-            contrast=req.contrast,
-            saturation=req.saturation,
-            sharpness=req.sharpness,
-        )
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting image processing: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set image processing",
-        )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Setting image processing: %r", req)
+    camera.set_image_processing(
+        brightness=req.brightness,
+        contrast=req.contrast,
+        saturation=req.saturation,
+        sharpness=req.sharpness,
+    )
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/hdr",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set HDR mode",
 )
 def set_hdr_mode(
     req: HdrModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set HDR (High Dynamic Range) mode.
 
@@ -1211,38 +1594,20 @@ def set_hdr_mode(
 
     Args:
         req: HDR mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting HDR mode: {req.mode}")
-
-    try:
-        camera.set_hdr_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting HDR mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set HDR mode",
-        )
+    logger.info("Setting HDR mode: %s", req.mode)
+    camera.set_hdr_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/roi",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set ROI",
 )
 def set_roi(
     req: RoiRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set Region of Interest (digital crop/zoom).
 
@@ -1254,38 +1619,20 @@ def set_roi(
 
     Args:
         req: ROI request with normalized coordinates
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting ROI: x={req.x}, y={req.y}, w={req.width}, h={req.height}")
-
-    try:
-        camera.set_roi(req.x, req.y, req.width, req.height)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting ROI: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set ROI",
-        )
+    logger.info("Setting ROI: x=%s, y=%s, w=%s, h=%s", req.x, req.y, req.width, req.height)
+    camera.set_roi(req.x, req.y, req.width, req.height)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/exposure_limits",
-    response_model=StatusResponse,
     tags=["Camera - Exposure"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set exposure limits",
 )
 def set_exposure_limits(
     req: ExposureLimitsRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set limits for auto-exposure algorithm.
 
@@ -1297,43 +1644,26 @@ def set_exposure_limits(
 
     Args:
         req: Exposure limits request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting exposure limits: {req}")
-
-    try:
-        camera.set_exposure_limits(
-            min_exposure_us=req.min_exposure_us,
-            max_exposure_us=req.max_exposure_us,
-            min_gain=req.min_gain,
-            max_gain=req.max_gain,
-        )
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting exposure limits: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set exposure limits",
-        )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Setting exposure limits: %r", req)
+    camera.set_exposure_limits(
+        min_exposure_us=req.min_exposure_us,
+        max_exposure_us=req.max_exposure_us,
+        min_gain=req.min_gain,
+        max_gain=req.max_gain,
+    )
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/lens_correction",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set lens correction",
 )
 def set_lens_correction(
     req: LensCorrectionRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Enable or disable lens shading correction.
 
@@ -1344,38 +1674,20 @@ def set_lens_correction(
 
     Args:
         req: Lens correction request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting lens correction: {req.enabled}")
-
-    try:
-        camera.set_lens_correction(req.enabled)
-        return StatusResponse()
-    except CameraNotAvailableError:
-        raise
-    except Exception as e:
-        logger.error(f"Error setting lens correction: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set lens correction",
-        )
+    logger.info("Setting lens correction: %s", req.enabled)
+    camera.set_lens_correction(req.enabled)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/transform",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set transform",
 )
 def set_transform(
     req: TransformRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set image transformation (flip/rotation).
 
@@ -1385,38 +1697,22 @@ def set_transform(
 
     Args:
         req: Transform request with flip/rotation settings
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting transform: hflip={req.hflip}, vflip={req.vflip}, rotation={req.rotation}")
-
-    try:
-        camera.set_transform(req.hflip, req.vflip, req.rotation)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting transform: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set transform",
-        )
+    logger.info(
+        "Setting transform: hflip=%s, vflip=%s, rotation=%s", req.hflip, req.vflip, req.rotation
+    )
+    camera.set_transform(req.hflip, req.vflip, req.rotation)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/day_night_mode",
-    response_model=StatusResponse,
     tags=["Camera - Scene Detection"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set day/night mode",
 )
 def set_day_night_mode(
     req: DayNightModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set day/night detection mode.
 
@@ -1429,41 +1725,23 @@ def set_day_night_mode(
 
     Args:
         req: Day/night mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting day/night mode: {req.mode}, threshold={req.threshold_lux}")
-
-    try:
-        camera.set_day_night_mode(req.mode, req.threshold_lux)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting day/night mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set day/night mode",
-        )
+    logger.info("Setting day/night mode: %s, threshold=%s", req.mode, req.threshold_lux)
+    camera.set_day_night_mode(req.mode, req.threshold_lux)
 
 
 # ========== New v2.1 Endpoints ==========
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/exposure_value",
-    response_model=StatusResponse,
     tags=["Camera - Exposure"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set exposure value",
 )
 def set_exposure_value(
     req: ExposureValueRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set exposure value (EV) compensation.
 
@@ -1477,38 +1755,20 @@ def set_exposure_value(
 
     Args:
         req: Exposure value request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting exposure value: {req.ev}")
-
-    try:
-        camera.set_exposure_value(req.ev)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting exposure value: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set exposure value",
-        )
+    logger.info("Setting exposure value: %s", req.ev)
+    camera.set_exposure_value(req.ev)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/noise_reduction",
-    response_model=StatusResponse,
     tags=["Camera - Image Processing"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set noise reduction mode",
 )
 def set_noise_reduction(
     req: NoiseReductionRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set noise reduction mode.
 
@@ -1521,38 +1781,20 @@ def set_noise_reduction(
 
     Args:
         req: Noise reduction request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting noise reduction mode: {req.mode}")
-
-    try:
-        camera.set_noise_reduction_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting noise reduction: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set noise reduction mode",
-        )
+    logger.info("Setting noise reduction mode: %s", req.mode)
+    camera.set_noise_reduction_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/ae_constraint_mode",
-    response_model=StatusResponse,
     tags=["Camera - Exposure"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set AE constraint mode",
 )
 def set_ae_constraint_mode(
     req: AeConstraintModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set auto-exposure constraint mode.
 
@@ -1564,38 +1806,20 @@ def set_ae_constraint_mode(
 
     Args:
         req: AE constraint mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting AE constraint mode: {req.mode}")
-
-    try:
-        camera.set_ae_constraint_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting AE constraint mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set AE constraint mode",
-        )
+    logger.info("Setting AE constraint mode: %s", req.mode)
+    camera.set_ae_constraint_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/ae_exposure_mode",
-    response_model=StatusResponse,
     tags=["Camera - Exposure"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set AE exposure mode",
 )
 def set_ae_exposure_mode(
     req: AeExposureModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set auto-exposure mode.
 
@@ -1607,38 +1831,20 @@ def set_ae_exposure_mode(
 
     Args:
         req: AE exposure mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting AE exposure mode: {req.mode}")
-
-    try:
-        camera.set_ae_exposure_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting AE exposure mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set AE exposure mode",
-        )
+    logger.info("Setting AE exposure mode: %s", req.mode)
+    camera.set_ae_exposure_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/awb_mode",
-    response_model=StatusResponse,
     tags=["Camera - White Balance"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to set AWB mode",
 )
 def set_awb_mode(
     req: AwbModeRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+    camera: CameraController,
+) -> None:
     """
     Set auto white balance mode (preset illuminants).
 
@@ -1653,74 +1859,36 @@ def set_awb_mode(
 
     Args:
         req: AWB mode request
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
-    logger.info(f"Setting AWB mode: {req.mode}")
-
-    try:
-        camera.set_awb_mode(req.mode)
-        return StatusResponse()
-    except (CameraNotAvailableError, InvalidParameterError):
-        raise
-    except Exception as e:
-        logger.error(f"Error setting AWB mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set AWB mode",
-        )
+    logger.info("Setting AWB mode: %s", req.mode)
+    camera.set_awb_mode(req.mode)
 
 
-@app.post(
+@_control_endpoint(
     "/v1/camera/autofocus_trigger",
-    response_model=StatusResponse,
     tags=["Camera - Autofocus"],
-    dependencies=[Depends(verify_api_key)],
+    error_detail="Failed to trigger autofocus",
 )
-def trigger_autofocus(
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-) -> StatusResponse:
+def trigger_autofocus(camera: CameraController) -> None:
     """
     Trigger a one-shot autofocus cycle.
 
     Initiates an autofocus scan. Useful when in manual or auto focus mode.
-
-    Returns:
-        StatusResponse: Confirmation
-
-    Raises:
-        HTTPException: If operation fails
     """
     logger.info("Triggering autofocus")
-
-    try:
-        camera.trigger_autofocus()
-        return StatusResponse()
-    except CameraNotAvailableError:
-        raise
-    except Exception as e:
-        logger.error(f"Error triggering autofocus: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to trigger autofocus",
-        )
+    camera.trigger_autofocus()
 
 
 @app.post(
     "/v1/camera/resolution",
-    response_model=StatusResponse,
+    response_model=None,
+    responses={200: {"model": StatusResponse}},
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def set_resolution(
+async def set_resolution(
     req: ResolutionRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-    streaming: Annotated[StreamingManager, Depends(get_streaming_manager)],
-) -> StatusResponse:
+    services: Annotated[tuple[CameraController, StreamingManager], Depends(get_services)],
+) -> Response:
     """
     Change camera resolution dynamically.
 
@@ -1742,53 +1910,47 @@ def set_resolution(
     Raises:
         HTTPException: If operation fails
     """
-    logger.info(f"Setting resolution: {req.width}x{req.height}")
+    camera, streaming = services
+    logger.info("Setting resolution: %sx%s", req.width, req.height)
+
+    # Reject bad arguments before streaming is paused for the change
+    camera.validate_reconfigure(width=req.width, height=req.height, fov_mode=req.fov_mode)
 
     # Use global lock to prevent concurrent reconfiguration operations
-    with _reconfiguration_lock:
+    async with _reconfiguration_lock:
         try:
-            # Set FOV mode if specified
-            if req.fov_mode is not None:
-                camera.set_fov_mode(req.fov_mode)
-                logger.info(f"FOV mode set to: {req.fov_mode}")
-
-            # Check if streaming is active
-            was_streaming = streaming.is_streaming()
-
-            # Stop streaming if active (must stop encoder first)
-            if was_streaming:
-                logger.info("Stopping streaming before resolution change")
-                streaming.stop()
-
-            # Change resolution (this will stop, reconfigure, and restart camera)
-            camera.set_resolution(req.width, req.height)
-
-            # Restart streaming if requested and was previously streaming
-            if req.restart_streaming and was_streaming:
-                logger.info("Restarting streaming after resolution change")
-                streaming.start()
-
-            return StatusResponse()
+            # Apply FOV mode and resolution in a single camera reconfiguration,
+            # with streaming paused around it
+            try:
+                await run_in_threadpool(
+                    streaming.reconfigure,
+                    partial(
+                        camera.reconfigure,
+                        width=req.width,
+                        height=req.height,
+                        fov_mode=req.fov_mode,
+                    ),
+                    resume=req.restart_streaming,
+                )
+            finally:
+                _invalidate_capabilities()
+
+            return Response(content=_OK_BODY, media_type="application/json")
         except (CameraNotAvailableError, InvalidParameterError):
             raise
         except Exception as e:
-            logger.error(f"Error setting resolution: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to set resolution",
-            )
+            logger.error("Error setting resolution: %s", e)
+            raise _HTTP_500_RESOLUTION.with_traceback(None)
 
 
 @app.post(
     "/v1/camera/framerate",
     response_model=FramerateResponse,
     tags=["Camera"],
-    dependencies=[Depends(verify_api_key)],
 )
-def set_framerate(
+async def set_framerate(
     req: FramerateRequest,
-    camera: Annotated[CameraController, Depends(get_camera_controller)],
-    streaming: Annotated[StreamingManager, Depends(get_streaming_manager)],
+    services: Annotated[tuple[CameraController, StreamingManager], Depends(get_services)],
 ) -> FramerateResponse:
     """
     Change camera framerate with intelligent clamping.
@@ -1814,48 +1976,43 @@ def set_framerate(
     Raises:
         HTTPException: If operation fails
     """
-    logger.info(f"Setting framerate: {req.framerate}fps")
+    camera, streaming = services
+    logger.info("Setting framerate: %sfps", req.framerate)
+
+    # Reject bad arguments before streaming is paused for the change
+    camera.validate_reconfigure(framerate=req.framerate)
 
     # Use global lock to prevent concurrent reconfiguration operations
-    with _reconfiguration_lock:
+    async with _reconfiguration_lock:
         try:
-            # Check if streaming is active
-            was_streaming = streaming.is_streaming()
-
-            # Stop streaming if active (must stop encoder first)
-            if was_streaming:
-                logger.info("Stopping streaming before framerate change")
-                streaming.stop()
-
-            # Change framerate (this will stop, reconfigure, and restart camera)
-            result = camera.set_framerate(req.framerate)
-
-            # Restart streaming if requested and was previously streaming
-            if req.restart_streaming and was_streaming:
-                logger.info("Restarting streaming after framerate change")
-                streaming.start()
+            # Change framerate with streaming paused around the reconfiguration
+            try:
+                result = await run_in_threadpool(
+                    streaming.reconfigure,
+                    partial(camera.set_framerate, req.framerate),
+                    resume=req.restart_streaming,
+                )
+            finally:
+                _invalidate_capabilities()
 
             return FramerateResponse(**result)
         except (CameraNotAvailableError, InvalidParameterError):
             raise
         except Exception as e:
-            logger.error(f"Error setting framerate: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to set framerate",
-            )
+            logger.error("Error setting framerate: %s", e)
+            raise _HTTP_500_FRAMERATE.with_traceback(None)
 
 
 @app.get(
     "/v1/camera/fov_mode",
-    response_model=FovModeResponse,
+    response_model=None,
+    responses={200: {"model": FovModeResponse}},
     summary="Get FOV mode",
     tags=["Camera"],
 )
-def get_fov_mode(
+async def get_fov_mode(
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-    _: Annotated[None, Depends(verify_api_key)],
-) -> FovModeResponse:
+) -> Response:
     """
     Get current field of view mode.
 
@@ -1870,31 +2027,23 @@ def get_fov_mode(
     """
     try:
         mode = camera.get_fov_mode()
-        description = (
-            "Full sensor readout with downscaling → Constant field of view"
-            if mode == "scale"
-            else "Sensor crop → Digital zoom effect (FOV reduces at lower resolutions)"
-        )
-        return FovModeResponse(mode=mode, description=description)
+        return Response(content=_FOV_BODIES[mode], media_type="application/json")
     except Exception as e:
-        logger.error(f"Error getting FOV mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get FOV mode",
-        )
+        logger.error("Error getting FOV mode: %s", e)
+        raise _HTTP_500_GET_FOV_MODE.with_traceback(None)
 
 
 @app.post(
     "/v1/camera/fov_mode",
-    response_model=FovModeResponse,
+    response_model=None,
+    responses={200: {"model": FovModeResponse}},
     summary="Set FOV mode",
     tags=["Camera"],
 )
-def set_fov_mode(
+async def set_fov_mode(
     req: FovModeRequest,
     camera: Annotated[CameraController, Depends(get_camera_controller)],
-    _: Annotated[None, Depends(verify_api_key)],
-) -> FovModeResponse:
+) -> Response:
     """
     Set field of view mode (scale or crop).
 
@@ -1922,24 +2071,211 @@ def set_fov_mode(
     Raises:
         HTTPException: If operation fails
     """
-    logger.info(f"Setting FOV mode: {req.mode}")
+    logger.info("Setting FOV mode: %s", req.mode)
+
+    # Only sets an attribute, so it runs inline, but like _run_camera_call it
+    # must not change the mode under a reconfiguration that is applying it
+    if _reconfiguration_lock.locked():
+        async with _reconfiguration_lock:
+            pass
 
     try:
         camera.set_fov_mode(req.mode)
-        description = (
-            "Full sensor readout with downscaling → Constant field of view"
-            if req.mode == "scale"
-            else "Sensor crop → Digital zoom effect (FOV reduces at lower resolutions)"
-        )
-        return FovModeResponse(mode=req.mode, description=description)
+        return Response(content=_FOV_BODIES[req.mode], media_type="application/json")
     except (CameraNotAvailableError, InvalidParameterError):
         raise
     except Exception as e:
-        logger.error(f"Error setting FOV mode: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to set FOV mode",
-        )
+        logger.error("Error setting FOV mode: %s", e)
+        raise _HTTP_500_SET_FOV_MODE.with_traceback(None)
+
+
+# ========== Batch Endpoint ==========
+
+
+def _resolution_kwargs(req: ResolutionRequest) -> dict[str, Any]:
+    kwargs = {"width": req.width, "height": req.height}
+    if req.fov_mode is not None:
+        kwargs["fov_mode"] = req.fov_mode
+    return kwargs
+
+
+def _framerate_kwargs(req: FramerateRequest) -> dict[str, Any]:
+    return {"framerate": req.framerate}
+
+
+def _batch_fov_mode(req: FovModeRequest, camera: CameraController) -> None:
+    camera.set_fov_mode(req.mode)
+
+
+def _batch_auto_exposure(req: AutoExposureRequest, camera: CameraController) -> None:
+    camera.set_auto_exposure(req.enabled)
+
+
+def _batch_manual_exposure(req: ManualExposureRequest, camera: CameraController) -> None:
+    camera.set_manual_exposure(exposure_us=req.exposure_us, gain=req.gain)
+
+
+def _batch_awb(req: AwbRequest, camera: CameraController) -> None:
+    camera.set_awb(req.enabled)
+
+
+# Batchable operations, named after the last segment of their endpoint path.
+# Reconfiguring operations map to CameraController.reconfigure() arguments
+# instead of an action, so they can be merged into one camera cycle.
+_BATCH_OPS: dict[str, tuple[Callable[..., Any], type[BaseModel] | None]] = {
+    path.rsplit("/", 1)[1]: entry for path, entry in _CONTROL_ENDPOINTS.items()
+}
+_BATCH_OPS["resolution"] = (_resolution_kwargs, ResolutionRequest)
+_BATCH_OPS["framerate"] = (_framerate_kwargs, FramerateRequest)
+_BATCH_OPS["fov_mode"] = (_batch_fov_mode, FovModeRequest)
+_BATCH_OPS["auto_exposure"] = (_batch_auto_exposure, AutoExposureRequest)
+_BATCH_OPS["manual_exposure"] = (_batch_manual_exposure, ManualExposureRequest)
+_BATCH_OPS["awb"] = (_batch_awb, AwbRequest)
+
+_RECONFIGURING_OPS = frozenset({"resolution", "framerate"})
+
+
+def _batch_call(op: str, func: Callable[..., Any], **kwargs) -> str | None:
+    """Run one batch step, returning an error message instead of raising."""
+    try:
+        func(**kwargs)
+    except CameraNotAvailableError:
+        raise
+    except CameraError as e:
+        return str(e)
+    except Exception as e:
+        logger.error("Batch operation %s failed: %s", op, e)
+        return f"Failed to apply {op}"
+    return None
+
+
+def _run_batch(
+    camera: CameraController,
+    calls: list[tuple[str, Callable[..., Any], BaseModel | None]],
+) -> list[BatchItemResult]:
+    """
+    Apply validated batch operations, collecting per-item results.
+
+    FOV mode items go first since they only take effect on the next
+    reconfiguration. All resolution/framerate items are then merged into
+    a single reconfigure() call, and the remaining controls are applied
+    in request order on top of the new configuration.
+    """
+    errors: dict[int, str | None] = {}
+
+    for index, (op, action, item_req) in enumerate(calls):
+        if op == "fov_mode":
+            errors[index] = _batch_call(op, action, req=item_req, camera=camera)
+
+    reconfig_indexes = []
+    reconfig_kwargs: dict[str, Any] = {}
+    for index, (op, to_kwargs, item_req) in enumerate(calls):
+        if op in _RECONFIGURING_OPS:
+            reconfig_indexes.append(index)
+            reconfig_kwargs.update(to_kwargs(item_req))
+    if reconfig_indexes:
+        error = _batch_call("reconfigure", camera.reconfigure, **reconfig_kwargs)
+        for index in reconfig_indexes:
+            errors[index] = error
+
+    for index, (op, action, item_req) in enumerate(calls):
+        if index in errors:
+            continue
+        if item_req is None:
+            errors[index] = _batch_call(op, action, camera=camera)
+        else:
+            errors[index] = _batch_call(op, action, req=item_req, camera=camera)
+
+    return [
+        BatchItemResult(op=op, ok=errors[index] is None, error=errors[index])
+        for index, (op, _, _) in enumerate(calls)
+    ]
+
+
+@app.post(
+    "/v1/camera/batch",
+    response_model=None,
+    responses={
+        200: {"model": BatchResponse, "description": "All operations applied"},
+        207: {"model": BatchResponse, "description": "Some operations failed"},
+    },
+    tags=["Camera"],
+)
+async def camera_batch(
+    req: BatchRequest,
+    services: Annotated[tuple[CameraController, StreamingManager], Depends(get_services)],
+) -> ORJSONResponse:
+    """
+    Apply several control operations in one request.
+
+    Each item names an operation after its endpoint (``auto_exposure``,
+    ``manual_exposure``, ``awb``, ``awb_preset``, ``lens_position``,
+    ``resolution``, ...) and carries that endpoint's
+    request body as ``params``. All items are validated before any is
+    applied, and each reports its own result. Resolution and framerate
+    items are merged into a single camera reconfiguration that runs before
+    the other controls, so streaming is stopped and restarted at most once.
+    The reconfiguration lock is only taken when the batch changes
+    resolution, framerate or FOV mode.
+
+    Args:
+        req: Batch request with ordered operations
+
+    Returns:
+        BatchResponse: Per-operation results (HTTP 207 if any failed)
+    """
+    camera, streaming = services
+    calls = []
+    for index, item in enumerate(req.items):
+        entry = _BATCH_OPS.get(item.op)
+        if entry is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"items[{index}]: unknown operation '{item.op}'",
+            )
+        action, request_model = entry
+        try:
+            item_req = request_model.model_validate(item.params) if request_model else None
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", "items", index, "params", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+        calls.append((item.op, action, item_req))
+
+    ops = {item.op for item in req.items}
+    reconfigures = not ops.isdisjoint(_RECONFIGURING_OPS)
+    lock = (
+        _reconfiguration_lock
+        if reconfigures or "fov_mode" in ops
+        else contextlib.nullcontext()
+    )
+
+    logger.info("Applying batch of %d operations", len(calls))
+
+    async with lock:
+        if reconfigures:
+            try:
+                results = await run_in_threadpool(
+                    streaming.reconfigure,
+                    partial(_run_batch, camera, calls),
+                    resume=req.restart_streaming,
+                )
+            finally:
+                _invalidate_capabilities()
+        else:
+            results = await run_in_threadpool(_run_batch, camera, calls)
+
+    failed = any(not result.ok for result in results)
+    return ORJSONResponse(
+        BatchResponse(
+            status="partial" if failed else "ok",
+            results=results,
+        ).model_dump(),
+        status_code=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK,
+    )
 
 
 # ========== System Status Endpoints (v2.5) ==========
@@ -1951,10 +2287,10 @@ def set_fov_mode(
     description="Get comprehensive system metrics including temperature, CPU, memory, network, and disk usage",
     tags=["System"],
 )
-def get_system_status(
+async def get_system_status(
+    request: Request,
     monitor: Annotated[SystemMonitor, Depends(get_system_monitor)],
-    _: Annotated[None, Depends(verify_api_key)],
-) -> SystemStatusResponse:
+) -> Response:
     """
     Get comprehensive system status metrics.
 
@@ -1974,23 +2310,41 @@ def get_system_status(
     - Checking resource usage (CPU, memory, disk)
     - Verifying system stability
 
+    Readings are reused for CONFIG.system_status_ttl seconds, so several
+    dashboards polling at once trigger a single scan. The response carries
+    an ETag and a matching Cache-Control max-age; a repeated If-None-Match
+    within that window gets an empty 304 Not Modified.
+
     Returns:
-        SystemStatusResponse: Comprehensive system metrics
+        Response: Comprehensive system metrics (SystemStatusResponse) as JSON
 
     Raises:
         HTTPException: If system monitor is not available
     """
+    global _system_status_cache
     logger.debug("Getting system status")
 
     try:
-        status_data = monitor.get_status()
-        return SystemStatusResponse(**status_data)
+        cached = _system_status_cache
+        if cached is None or time.monotonic() >= cached[0]:
+            async with _system_status_lock:
+                cached = _system_status_cache
+                if cached is None or time.monotonic() >= cached[0]:
+                    # get_status() samples CPU usage for 100 ms and shells
+                    # out to vcgencmd, so keep it off the event loop
+                    status_data = await run_in_threadpool(monitor.get_status)
+                    body = orjson.dumps(SystemStatusResponse(**status_data).model_dump())
+                    cached = (time.monotonic() + CONFIG.system_status_ttl, body, _etag(body))
+                    _system_status_cache = cached
     except Exception as e:
-        logger.error(f"Error getting system status: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get system status",
-        )
+        logger.error("Error getting system status: %s", e)
+        raise _HTTP_500_SYSTEM_STATUS.with_traceback(None)
+
+    _, body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": f"max-age={int(CONFIG.system_status_ttl)}"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get(
@@ -2000,11 +2354,10 @@ def get_system_status(
     description="Get logs from the pi-camera-service with optional filtering by lines, level, and search pattern",
     tags=["System"],
 )
-def get_system_logs(
+async def get_system_logs(
     lines: Annotated[int, Query(ge=1, le=10000, description="Number of log lines to retrieve")] = 100,
     level: Annotated[Optional[str], Query(description="Filter by log level (INFO, WARNING, ERROR)")] = None,
     search: Annotated[Optional[str], Query(description="Search pattern to filter logs")] = None,
-    _: Annotated[None, Depends(verify_api_key)] = None,
 ) -> LogsResponse:
     """
     Get service logs with optional filtering.
@@ -2028,14 +2381,15 @@ def get_system_logs(
     Raises:
         HTTPException: If log retrieval fails
     """
-    logger.debug(f"Getting system logs: lines={lines}, level={level}, search={search}")
+    logger.debug("Getting system logs: lines=%s, level=%s, search=%s", lines, level, search)
 
     try:
         # Build journalctl command (no sudo needed - journalctl allows reading own service logs)
         cmd = ["journalctl", "-u", "pi-camera-service", "-n", str(lines), "--no-pager"]
 
         # Execute journalctl
-        result = subprocess.run(
+        result = await run_in_threadpool(
+            subprocess.run,
             cmd,
             capture_output=True,
             text=True,
@@ -2068,12 +2422,9 @@ def get_system_logs(
 
     except subprocess.TimeoutExpired:
         logger.error("Timeout while retrieving logs")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Log retrieval timed out",
-        )
+        raise _HTTP_504_LOGS.with_traceback(None)
     except Exception as e:
-        logger.error(f"Error getting system logs: {e}")
+        logger.error("Error getting system logs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve logs: {str(e)}",
@@ -2089,7 +2440,6 @@ def get_system_logs(
 async def stream_system_logs(
     level: Annotated[Optional[str], Query(description="Filter by log level (INFO, WARNING, ERROR)")] = None,
     search: Annotated[Optional[str], Query(description="Search pattern to filter logs")] = None,
-    _: Annotated[None, Depends(verify_api_key)] = None,
 ):
     """
     Stream service logs in real-time using Server-Sent Events (SSE).
@@ -2120,7 +2470,7 @@ async def stream_system_logs(
     Raises:
         HTTPException: If log streaming fails
     """
-    logger.debug(f"Starting log stream: level={level}, search={search}")
+    logger.debug("Starting log stream: level=%s, search=%s", level, search)
 
     async def log_generator():
         """Generate log events as they arrive."""
@@ -2165,7 +2515,7 @@ async def stream_system_logs(
             # Client disconnected
             logger.debug("Log stream cancelled by client")
         except Exception as e:
-            logger.error(f"Error in log stream: {e}")
+            logger.error("Error in log stream: %s", e)
             yield f"data: ERROR: {str(e)}\n\n"
         finally:
             # Clean up process
@@ -2177,7 +2527,7 @@ async def stream_system_logs(
                     process.kill()
                     await process.wait()
                 except Exception as e:
-                    logger.error(f"Error cleaning up log stream process: {e}")
+                    logger.error("Error cleaning up log stream process: %s", e)
 
     return FastAPIStreamingResponse(
         log_generator(),
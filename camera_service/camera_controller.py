@@ -11,9 +11,12 @@ import base64
 import io
 import logging
 import os
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from threading import RLock
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from picamera2 import Picamera2
 from PIL import Image
@@ -25,6 +28,19 @@ from camera_service.exceptions import (
     InvalidParameterError,
 )
 
+try:
+    import pybase64
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
+try:
+    import numpy as np
+    import simplejpeg
+    HAS_SIMPLEJPEG = True
+except ImportError:
+    HAS_SIMPLEJPEG = False
+
 logger = logging.getLogger(__name__)
 
 # Hardware limits for Pi Camera Module v3
@@ -36,6 +52,14 @@ MIN_GAIN = 1.0
 MAX_LENS_POSITION = 15.0
 MIN_LENS_POSITION = 0.0
 
+# libcamera tuning file locations, tried in order: Pi 5 (pisp), then
+# Pi 4/Zero 2W (vc4)
+PISP_TUNING_PATH = "/usr/share/libcamera/ipa/rpi/pisp/{model}{noir_suffix}.json"
+VC4_TUNING_PATH = "/usr/share/libcamera/ipa/rpi/vc4/{model}{noir_suffix}.json"
+
+# Number of recent frames whose metadata is kept for get_status_history()
+METADATA_HISTORY_SIZE = 8
+
 # Framerate limits based on resolution (approximate for IMX708)
 # These are based on pixel count and sensor readout limitations
 def calculate_max_framerate(width: int, height: int) -> float:
@@ -121,8 +145,8 @@ def calculate_optimal_bitrate(width: int, height: int, framerate: float) -> int:
     bitrate = max(MIN_BITRATE, min(bitrate, MAX_BITRATE))
 
     logger.debug(
-        f"Calculated optimal bitrate for {width}x{height}@{framerate}fps: "
-        f"{bitrate / 1_000_000:.1f} Mbps"
+        "Calculated optimal bitrate for %dx%d@%sfps: %.1f Mbps",
+        width, height, framerate, bitrate / 1_000_000,
     )
 
     return int(bitrate)
@@ -137,14 +161,121 @@ AWB_PRESETS = {
 }
 
 
+# Mode name -> libcamera control enum value. Built once at import time so
+# the setters validate with a single dict lookup; insertion order is the
+# order listed in error messages and capabilities.
+AF_MODES = {"default": 0, "manual": 0, "auto": 1, "continuous": 2}
+AF_RANGES = {"normal": 0, "macro": 1, "full": 2}
+NOISE_REDUCTION_MODES = {
+    "off": 0,
+    "fast": 1,
+    "high_quality": 2,
+    "minimal": 3,
+    "zsl": 4,
+}
+AE_CONSTRAINT_MODES = {"normal": 0, "highlight": 1, "shadows": 2, "custom": 3}
+AE_EXPOSURE_MODES = {"normal": 0, "short": 1, "long": 2, "custom": 3}
+AWB_MODES = {
+    "auto": 0,
+    "tungsten": 1,
+    "fluorescent": 2,
+    "indoor": 3,
+    "daylight": 4,
+    "cloudy": 5,
+    "custom": 7,
+}
+
+# Modes handled in Python rather than mapped to a single control value
+HDR_MODES = ("off", "auto", "sensor", "single-exp")
+DAY_NIGHT_MODES = ("manual", "auto")
+FOV_MODES = ("scale", "crop")
+
+# Fixed set_controls payloads for the AE/AWB toggles, keyed by enabled.
+# Picamera2 only reads these, so they are shared and must never be mutated.
+AE_CONTROLS = {
+    True: {"AeEnable": True, "ExposureTime": 0},  # Let auto-exposure decide
+    False: {"AeEnable": False},
+}
+AWB_CONTROLS = {
+    True: {"AwbEnable": True},
+    False: {"AwbEnable": False},
+}
+
+
+def _encode_jpeg(array: Any, width: int, height: int, quality: int = 95) -> bytes:
+    """
+    Encode a captured frame as JPEG, resized to width x height.
+
+    Uses simplejpeg (libjpeg-turbo) for 3-channel frames when it is
+    installed: it releases the GIL while encoding, so other requests keep
+    running. Anything else is encoded with Pillow.
+
+    Args:
+        array: Frame returned by Picamera2.capture_array()
+        width: Output width in pixels
+        height: Output height in pixels
+        quality: JPEG quality (1-100)
+
+    Returns:
+        bytes: JPEG image data
+    """
+    if HAS_SIMPLEJPEG and array.ndim == 3 and array.shape[2] == 3:
+        if array.shape[:2] != (height, width):
+            resized = Image.fromarray(array).resize((width, height), Image.Resampling.LANCZOS)
+            array = np.asarray(resized)
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(array), quality=quality, colorspace="RGB"
+        )
+
+    img = Image.fromarray(array)
+    if img.size != (width, height):
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
 class CameraController:
     """
     Thread-safe controller for Raspberry Pi camera operations.
 
     Manages camera configuration, exposure control, white balance,
-    and metadata retrieval. Uses RLock for reentrant thread safety.
+    and metadata retrieval. A plain Lock guards camera access; methods that
+    need another locked operation call its *_locked helper instead of
+    re-acquiring it.
     """
 
+    # Fixed attribute set: every setter reads several of these per request,
+    # and slot descriptors avoid the per-instance __dict__ lookup
+    __slots__ = (
+        "_picam2",
+        "_lock",
+        "_configured",
+        "_auto_exposure",
+        "_autofocus_mode",
+        "_hdr_mode",
+        "_lens_correction_enabled",
+        "_day_night_mode",
+        "_day_night_threshold_lux",
+        "_current_width",
+        "_current_height",
+        "_current_framerate",
+        "_current_bitrate",
+        "_fov_mode",
+        "_exposure_value",
+        "_noise_reduction_mode",
+        "_ae_constraint_mode",
+        "_ae_exposure_mode",
+        "_latest_metadata",
+        "_metadata_history",
+        "_applied_ae",
+        "_applied_awb",
+        "_applied_exposure",
+        "_camera_info",
+        "_is_wide_camera",
+    )
+
     def __init__(self) -> None:
         """
         Initialize the camera controller.
@@ -153,7 +284,9 @@ class CameraController:
             CameraNotAvailableError: If camera hardware is not available
         """
         self._picam2: Optional[Picamera2] = None
-        self._lock = RLock()  # Reentrant lock for nested lock acquisition
+        # Plain (non-reentrant) lock: methods that need another locked
+        # operation call its *_locked helper instead of re-acquiring
+        self._lock = Lock()
         self._configured = False
         self._auto_exposure = CONFIG.default_auto_exposure
         self._autofocus_mode = "continuous"  # default, manual, auto, continuous
@@ -179,11 +312,50 @@ class CameraController:
         self._ae_constraint_mode = "normal"  # Default: normal constraint
         self._ae_exposure_mode = "normal"  # Default: normal exposure
 
+        # Metadata of the most recently completed frame, published by
+        # _store_frame_metadata from picamera2's event thread
+        self._latest_metadata: Optional[Dict[str, Any]] = None
+        # (monotonic timestamp, metadata) of the last few frames
+        self._metadata_history: Deque[Tuple[float, Dict[str, Any]]] = deque(
+            maxlen=METADATA_HISTORY_SIZE
+        )
+
+        # AE/AWB/manual exposure values last sent with set_controls, used to
+        # skip repeats; None means unknown (not sent since configuration)
+        self._applied_ae: Optional[bool] = None
+        self._applied_awb: Optional[bool] = None
+        self._applied_exposure: Optional[tuple] = None
+
+        # Result of the last non-empty libcamera camera enumeration
+        self._camera_info: Optional[list] = None
+
         # Detect wide-angle camera for optimal sensor mode selection (v2.7.0)
         self._is_wide_camera = self._detect_wide_camera()
 
         logger.info("=== CameraController v2.7.0 initialized with wide-angle support ===" )
-        logger.debug(f"Initialized with: autofocus_mode={self._autofocus_mode}, hdr_mode={self._hdr_mode}, is_wide={self._is_wide_camera}")
+        logger.debug(
+            "Initialized with: autofocus_mode=%s, hdr_mode=%s, is_wide=%s",
+            self._autofocus_mode, self._hdr_mode, self._is_wide_camera,
+        )
+
+    def _get_camera_info(self) -> list:
+        """
+        Return libcamera's camera list, enumerating only until one is found.
+
+        global_camera_info() walks the media devices on every call; __init__
+        and configure() both need it, so a non-empty result is kept until
+        cleanup(). An empty result is not cached, so a camera connected
+        later is still picked up.
+
+        Returns:
+            list: Camera info dicts, as returned by Picamera2.global_camera_info()
+        """
+        cameras = self._camera_info
+        if cameras is None:
+            cameras = Picamera2.global_camera_info()
+            if cameras:
+                self._camera_info = cameras
+        return cameras
 
     def _check_camera_available(self) -> bool:
         """
@@ -193,10 +365,10 @@ class CameraController:
             bool: True if at least one camera is detected
         """
         try:
-            cameras = Picamera2.global_camera_info()
+            cameras = self._get_camera_info()
             return len(cameras) > 0
         except Exception as e:
-            logger.error(f"Error checking camera availability: {e}")
+            logger.error("Error checking camera availability: %s", e)
             return False
 
     def _detect_wide_camera(self) -> bool:
@@ -211,7 +383,7 @@ class CameraController:
             bool: True if wide-angle camera detected, False otherwise
         """
         try:
-            cameras = Picamera2.global_camera_info()
+            cameras = self._get_camera_info()
             if not cameras:
                 return False
 
@@ -223,15 +395,15 @@ class CameraController:
             is_wide = "wide" in model or "imx708_wide" in model
 
             if is_wide:
-                logger.info(f"Wide-angle camera detected: {camera_info.get('Model', 'Unknown')}")
+                logger.info("Wide-angle camera detected: %s", camera_info.get("Model", "Unknown"))
                 logger.info("Sensor mode selection optimized for 120° FOV preservation")
             else:
-                logger.info(f"Standard camera detected: {camera_info.get('Model', 'Unknown')}")
+                logger.info("Standard camera detected: %s", camera_info.get("Model", "Unknown"))
 
             return is_wide
 
         except Exception as e:
-            logger.warning(f"Could not detect camera type: {e}. Assuming standard camera.")
+            logger.warning("Could not detect camera type: %s. Assuming standard camera.", e)
             return False
 
     def _get_optimal_sensor_mode(self, target_width: int, target_height: int) -> tuple:
@@ -266,14 +438,16 @@ class CameraController:
             # For all resolutions up to 2304x1296: use Mode 1 (full sensor with binning)
             if target_width <= 2304 and target_height <= 1296:
                 logger.debug(
-                    f"[Wide Camera] Selected sensor mode 1 (2304x1296 @ 56fps) for {target_width}x{target_height} "
-                    f"to preserve 120° FOV"
+                    "[Wide Camera] Selected sensor mode 1 (2304x1296 @ 56fps) for %dx%d "
+                    "to preserve 120° FOV",
+                    target_width, target_height,
                 )
                 return (2304, 1296)
             # For 4K: use Mode 0 (full sensor, no binning)
             else:
                 logger.debug(
-                    f"[Wide Camera] Selected sensor mode 0 (4608x2592 @ 14fps) for {target_width}x{target_height}"
+                    "[Wide Camera] Selected sensor mode 0 (4608x2592 @ 14fps) for %dx%d",
+                    target_width, target_height,
                 )
                 return (4608, 2592)
 
@@ -282,21 +456,24 @@ class CameraController:
             # For 720p and below: use fast mode (1536x864 @ 120fps)
             if target_width <= 1536 and target_height <= 864:
                 logger.debug(
-                    f"[Standard Camera] Selected sensor mode 2 (1536x864 @ 120fps) for {target_width}x{target_height}"
+                    "[Standard Camera] Selected sensor mode 2 (1536x864 @ 120fps) for %dx%d",
+                    target_width, target_height,
                 )
                 return (1536, 864)
 
             # For 1080p/1440p: use medium mode (2304x1296 @ 56fps)
             elif target_width <= 2304 and target_height <= 1296:
                 logger.debug(
-                    f"[Standard Camera] Selected sensor mode 1 (2304x1296 @ 56fps) for {target_width}x{target_height}"
+                    "[Standard Camera] Selected sensor mode 1 (2304x1296 @ 56fps) for %dx%d",
+                    target_width, target_height,
                 )
                 return (2304, 1296)
 
             # For 4K: use full sensor (4608x2592 @ 14fps)
             else:
                 logger.debug(
-                    f"[Standard Camera] Selected sensor mode 0 (4608x2592 @ 14fps) for {target_width}x{target_height}"
+                    "[Standard Camera] Selected sensor mode 0 (4608x2592 @ 14fps) for %dx%d",
+                    target_width, target_height,
                 )
                 return (4608, 2592)
 
@@ -361,16 +538,17 @@ class CameraController:
                 self._current_framerate
             )
             logger.info(
-                f"Using calculated bitrate: {calculated / 1_000_000:.1f} Mbps "
-                f"for {self._current_width}x{self._current_height}@{self._current_framerate}fps"
+                "Using calculated bitrate: %.1f Mbps for %dx%d@%sfps",
+                calculated / 1_000_000,
+                self._current_width, self._current_height, self._current_framerate,
             )
             return calculated
 
         except Exception as e:
             # Fallback 1: Use .env configured value
             logger.warning(
-                f"Bitrate calculation failed: {e}. "
-                f"Falling back to CONFIG.bitrate = {CONFIG.bitrate / 1_000_000:.1f} Mbps"
+                "Bitrate calculation failed: %s. Falling back to CONFIG.bitrate = %.1f Mbps",
+                e, CONFIG.bitrate / 1_000_000,
             )
             if hasattr(CONFIG, 'bitrate') and CONFIG.bitrate > 0:
                 return CONFIG.bitrate
@@ -389,35 +567,47 @@ class CameraController:
         with self._lock:
             return self._current_bitrate
 
-    def _detect_tuning_file(self) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _detect_tuning_file(
+        tuning_file: Optional[str], model: str, is_noir: bool
+    ) -> Optional[str]:
         """
         Auto-detect the appropriate tuning file for the camera.
 
+        The result is cached per (tuning_file, model, is_noir), so the stat
+        calls only happen on the first configure() for a given setup;
+        cleanup() clears the cache.
+
+        Args:
+            tuning_file: Explicitly configured tuning file, if any
+            model: Camera sensor model (e.g. "imx708")
+            is_noir: Whether the camera is a NoIR variant
+
         Returns:
             str: Path to tuning file, or None if not found
         """
         # If explicitly configured, use that
-        if CONFIG.tuning_file is not None:
-            if os.path.exists(CONFIG.tuning_file):
-                logger.info(f"Using configured tuning file: {CONFIG.tuning_file}")
-                return CONFIG.tuning_file
+        if tuning_file is not None:
+            if os.path.exists(tuning_file):
+                logger.info("Using configured tuning file: %s", tuning_file)
+                return tuning_file
             else:
-                logger.warning(f"Configured tuning file not found: {CONFIG.tuning_file}")
+                logger.warning("Configured tuning file not found: %s", tuning_file)
 
         # Auto-detect based on camera model and NoIR flag
-        model = CONFIG.camera_model
-        noir_suffix = "_noir" if CONFIG.is_noir else ""
+        noir_suffix = "_noir" if is_noir else ""
 
         # Try Pi 5 path first (pisp)
-        pi5_path = f"/usr/share/libcamera/ipa/rpi/pisp/{model}{noir_suffix}.json"
+        pi5_path = PISP_TUNING_PATH.format(model=model, noir_suffix=noir_suffix)
         if os.path.exists(pi5_path):
-            logger.info(f"Auto-detected tuning file (Pi 5): {pi5_path}")
+            logger.info("Auto-detected tuning file (Pi 5): %s", pi5_path)
             return pi5_path
 
         # Try Pi 4/Zero 2W path (vc4)
-        pi4_path = f"/usr/share/libcamera/ipa/rpi/vc4/{model}{noir_suffix}.json"
+        pi4_path = VC4_TUNING_PATH.format(model=model, noir_suffix=noir_suffix)
         if os.path.exists(pi4_path):
-            logger.info(f"Auto-detected tuning file (Pi 4): {pi4_path}")
+            logger.info("Auto-detected tuning file (Pi 4): %s", pi4_path)
             return pi4_path
 
         logger.warning("Could not auto-detect tuning file, using default")
@@ -432,65 +622,82 @@ class CameraController:
             ConfigurationError: If configuration fails
         """
         with self._lock:
-            if self._configured:
-                logger.debug("Camera already configured, skipping")
-                return
+            self._configure_locked()
 
-            logger.info("Configuring camera...")
+    def _configure_locked(self) -> None:
+        """Body of configure(); the caller must hold self._lock."""
+        if self._configured:
+            logger.debug("Camera already configured, skipping")
+            return
 
-            # Check camera availability
-            if not self._check_camera_available():
-                raise CameraNotAvailableError(
-                    "No camera detected. Check hardware connection."
-                )
+        logger.info("Configuring camera...")
 
-            try:
-                # Detect and load tuning file
-                tuning_file = self._detect_tuning_file()
+        # Check camera availability
+        if not self._check_camera_available():
+            raise CameraNotAvailableError(
+                "No camera detected. Check hardware connection."
+            )
 
-                # Initialize Picamera2 with tuning file
-                if tuning_file:
-                    self._picam2 = Picamera2(tuning=Picamera2.load_tuning_file(tuning_file))
-                else:
-                    self._picam2 = Picamera2()
+        try:
+            # Detect and load tuning file
+            tuning_file = self._detect_tuning_file(
+                CONFIG.tuning_file, CONFIG.camera_model, CONFIG.is_noir
+            )
 
-                # Build configuration dict
-                config_dict = {
-                    "main": {
-                        "size": (CONFIG.width, CONFIG.height),
-                        "format": "YUV420",
-                    },
-                    "controls": {
-                        "FrameRate": CONFIG.framerate,
-                        "AfMode": 2,  # Continuous autofocus by default
-                    },
-                }
+            # Initialize Picamera2 with tuning file
+            if tuning_file:
+                self._picam2 = Picamera2(tuning=Picamera2.load_tuning_file(tuning_file))
+            else:
+                self._picam2 = Picamera2()
 
-                # Add sensor config if in scale mode (constant FOV)
-                sensor_config = self._get_sensor_config()
-                if sensor_config is not None:
-                    config_dict["sensor"] = sensor_config
+            # Keep the latest frame metadata so status reads don't wait
+            # for the next frame
+            self._picam2.post_callback = self._store_frame_metadata
+
+            # Build configuration dict
+            config_dict = {
+                "main": {
+                    "size": (CONFIG.width, CONFIG.height),
+                    "format": "YUV420",
+                },
+                "controls": {
+                    "FrameRate": CONFIG.framerate,
+                    "AfMode": 2,  # Continuous autofocus by default
+                },
+            }
 
-                # Create video configuration
-                video_config = self._picam2.create_video_configuration(**config_dict)
-                self._picam2.configure(video_config)
+            # Add sensor config if in scale mode (constant FOV)
+            sensor_config = self._get_sensor_config()
+            if sensor_config is not None:
+                config_dict["sensor"] = sensor_config
 
-                logger.info(
-                    f"Camera configured: {CONFIG.width}x{CONFIG.height} "
-                    f"@ {CONFIG.framerate}fps, bitrate={CONFIG.bitrate}bps"
-                )
+            # Create video configuration
+            video_config = self._picam2.create_video_configuration(**config_dict)
+            self._picam2.configure(video_config)
+
+            logger.info(
+                "Camera configured: %dx%d @ %sfps, bitrate=%dbps",
+                CONFIG.width, CONFIG.height, CONFIG.framerate, CONFIG.bitrate,
+            )
 
-                # Apply initial settings
-                self.set_auto_exposure(CONFIG.default_auto_exposure)
-                if CONFIG.enable_awb:
-                    self._picam2.set_controls({"AwbEnable": True})
-                    logger.debug("Auto white balance enabled")
+            # Apply initial settings in one set_controls call so they land on
+            # the same frame
+            initial_controls = dict(AE_CONTROLS[CONFIG.default_auto_exposure])
+            if CONFIG.enable_awb:
+                initial_controls.update(AWB_CONTROLS[True])
+            self._picam2.set_controls(initial_controls)
+            self._auto_exposure = CONFIG.default_auto_exposure
+            logger.debug("Initial controls applied: %s", initial_controls)
 
-                self._configured = True
+            # Start-up values are not tracked: the first explicit call to
+            # each setter is always sent
+            self._forget_applied_controls()
 
-            except Exception as e:
-                logger.error(f"Failed to configure camera: {e}")
-                raise ConfigurationError(f"Camera configuration failed: {e}") from e
+            self._configured = True
+
+        except Exception as e:
+            logger.error("Failed to configure camera: %s", e)
+            raise ConfigurationError(f"Camera configuration failed: {e}") from e
 
     @property
     def picam2(self) -> Picamera2:
@@ -506,7 +713,7 @@ class CameraController:
         """
         with self._lock:
             if not self._configured:
-                self.configure()
+                self._configure_locked()
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
             return self._picam2
@@ -524,13 +731,24 @@ class CameraController:
                     self._picam2.close()
                     logger.info("Camera closed successfully")
                 except Exception as e:
-                    logger.error(f"Error closing camera: {e}")
+                    logger.error("Error closing camera: %s", e)
                 finally:
                     self._picam2 = None
                     self._configured = False
+                    self._latest_metadata = None
+                    self._metadata_history.clear()
+                    self._camera_info = None
+                    self._detect_tuning_file.cache_clear()
+                    self._forget_applied_controls()
 
     # ---------- Exposure & Gain Controls ----------
 
+    def _forget_applied_controls(self) -> None:
+        """Mark AE/AWB state as unknown so the next setter call is always sent."""
+        self._applied_ae = None
+        self._applied_awb = None
+        self._applied_exposure = None
+
     def set_auto_exposure(self, enabled: bool = True) -> None:
         """
         Enable or disable automatic exposure control.
@@ -542,46 +760,64 @@ class CameraController:
             CameraNotAvailableError: If camera is not configured
         """
         with self._lock:
-            if self._picam2 is None:
-                raise CameraNotAvailableError("Camera not initialized")
+            self._set_auto_exposure_locked(enabled)
 
-            controls: Dict[str, Any] = {
-                "AeEnable": enabled,
-            }
-            if enabled:
-                controls["ExposureTime"] = 0  # Let auto-exposure decide
+    def _set_auto_exposure_locked(self, enabled: bool) -> None:
+        """Body of set_auto_exposure(); the caller must hold self._lock."""
+        if self._picam2 is None:
+            raise CameraNotAvailableError("Camera not initialized")
 
-            self._picam2.set_controls(controls)
-            self._auto_exposure = enabled
+        if enabled is self._applied_ae:
+            logger.debug("Auto exposure already %s, skipping", enabled)
+            return
+
+        self._picam2.set_controls(AE_CONTROLS[enabled])
+        self._auto_exposure = enabled
+        self._applied_ae = enabled
+        self._applied_exposure = None
 
-            logger.info(f"Auto exposure {'enabled' if enabled else 'disabled'}")
+        logger.info("Auto exposure %s", "enabled" if enabled else "disabled")
 
-    def set_manual_exposure(self, exposure_us: int, gain: float = 1.0) -> None:
+    def set_manual_exposure(
+        self, exposure_us: int, gain: float = 1.0, clamp: bool = False
+    ) -> None:
         """
         Set manual exposure parameters.
 
         Args:
             exposure_us: Exposure time in microseconds (100 - 1,000,000)
             gain: Analogue gain (1.0 - 16.0)
+            clamp: Clamp out-of-range values to the nearest limit instead of
+                raising (for host-side AE loops whose computed values may
+                land slightly outside the range)
 
         Raises:
             InvalidParameterError: If parameters are out of valid range
+                and clamp is False
             CameraNotAvailableError: If camera is not configured
         """
-        # Validate parameters
-        if exposure_us < MIN_EXPOSURE_US:
-            raise InvalidParameterError(
-                f"exposure_us must be >= {MIN_EXPOSURE_US} (got {exposure_us})"
-            )
-        if exposure_us > MAX_EXPOSURE_US:
-            raise InvalidParameterError(
-                f"exposure_us must be <= {MAX_EXPOSURE_US} (got {exposure_us})"
-            )
-        if gain < MIN_GAIN:
-            raise InvalidParameterError(
-                f"gain must be >= {MIN_GAIN} (got {gain})"
-            )
-        if gain > MAX_GAIN:
+        if clamp:
+            exposure_us = min(max(exposure_us, MIN_EXPOSURE_US), MAX_EXPOSURE_US)
+            gain = min(max(gain, MIN_GAIN), MAX_GAIN)
+
+        # Validate parameters: one chained check on the (common) valid path,
+        # the individual bounds only to build the error message
+        if not (
+            MIN_EXPOSURE_US <= exposure_us <= MAX_EXPOSURE_US
+            and MIN_GAIN <= gain <= MAX_GAIN
+        ):
+            if exposure_us < MIN_EXPOSURE_US:
+                raise InvalidParameterError(
+                    f"exposure_us must be >= {MIN_EXPOSURE_US} (got {exposure_us})"
+                )
+            if exposure_us > MAX_EXPOSURE_US:
+                raise InvalidParameterError(
+                    f"exposure_us must be <= {MAX_EXPOSURE_US} (got {exposure_us})"
+                )
+            if gain < MIN_GAIN:
+                raise InvalidParameterError(
+                    f"gain must be >= {MIN_GAIN} (got {gain})"
+                )
             raise InvalidParameterError(
                 f"gain must be <= {MAX_GAIN} (got {gain})"
             )
@@ -590,14 +826,21 @@ class CameraController:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
+            exposure = (exposure_us, gain)
+            if self._applied_ae is False and exposure == self._applied_exposure:
+                logger.debug("Manual exposure unchanged, skipping")
+                return
+
             self._picam2.set_controls({
                 "AeEnable": False,
                 "ExposureTime": exposure_us,
                 "AnalogueGain": gain,
             })
             self._auto_exposure = False
+            self._applied_ae = False
+            self._applied_exposure = exposure
 
-            logger.info(f"Manual exposure set: {exposure_us}µs, gain={gain}")
+            logger.info("Manual exposure set: %sµs, gain=%s", exposure_us, gain)
 
     def set_awb(self, enabled: bool = True) -> None:
         """
@@ -613,14 +856,65 @@ class CameraController:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            self._picam2.set_controls({
-                "AwbEnable": enabled,
-            })
+            if enabled is self._applied_awb:
+                logger.debug("Auto white balance already %s, skipping", enabled)
+                return
+
+            self._picam2.set_controls(AWB_CONTROLS[enabled])
+            self._applied_awb = enabled
 
-            logger.info(f"Auto white balance {'enabled' if enabled else 'disabled'}")
+            logger.info("Auto white balance %s", "enabled" if enabled else "disabled")
 
     # ---------- Status & Metadata ----------
 
+    def _store_frame_metadata(self, request: Any) -> None:
+        """
+        Picamera2 post_callback: publish the metadata of a completed frame.
+
+        Runs on picamera2's event thread once per frame. The dict is replaced
+        with a single reference store and deque.append is atomic, so readers
+        never see a partial update and no lock is needed.
+        """
+        meta = request.get_metadata()
+        self._latest_metadata = meta
+        self._metadata_history.append((time.monotonic(), meta))
+
+    def _current_metadata(self) -> Dict[str, Any]:
+        """
+        Return the latest frame metadata.
+
+        Falls back to capture_metadata(), which blocks until the next frame,
+        only when no frame has completed yet.
+        """
+        meta = self._latest_metadata
+        if meta is None:
+            meta = self._picam2.capture_metadata()
+        return meta
+
+    def get_status_history(self) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Get the metadata of the most recently completed frames.
+
+        Useful for clients that want multi-frame statistics (e.g. a host-side
+        exposure loop averaging lux) without polling at the frame rate.
+
+        Returns:
+            list: Up to METADATA_HISTORY_SIZE (monotonic timestamp, metadata)
+            tuples, oldest first; empty until the first frame completes
+        """
+        return list(self._metadata_history)
+
+    def _scene_mode_for_lux(self, lux: Optional[float]) -> str:
+        """Classify a lux reading as "day", "low_light" or "night"."""
+        if lux is None:
+            return "unknown"
+        elif lux > 100:
+            return "day"
+        elif lux > self._day_night_threshold_lux:
+            return "low_light"
+        else:
+            return "night"
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current camera status and metadata.
@@ -631,20 +925,22 @@ class CameraController:
         Raises:
             CameraNotAvailableError: If camera is not configured
         """
-        with self._lock:
-            if self._picam2 is None or not self._configured:
-                raise CameraNotAvailableError("Camera not configured")
+        picam2 = self._picam2
+        if picam2 is None or not self._configured:
+            raise CameraNotAvailableError("Camera not configured")
 
-            try:
-                meta = self._picam2.capture_metadata()
-                logger.debug(f"get_status: _autofocus_mode={self._autofocus_mode}, _hdr_mode={self._hdr_mode}")
-
-                # Get scene mode
-                try:
-                    scene_mode = self.get_scene_mode()
-                except Exception as scene_ex:
-                    logger.warning(f"Failed to get scene mode: {scene_ex}")
-                    scene_mode = "unknown"
+        try:
+            # Outside the lock: until the first frame completes this waits
+            # for one in capture_metadata(), which must not hold up setters
+            # and other readers for a frame time
+            meta = self._latest_metadata
+            if meta is None:
+                meta = picam2.capture_metadata()
+
+            # The lock keeps the settings fields below a coherent snapshot
+            with self._lock:
+                # Scene mode from the same frame's lux reading
+                scene_mode = self._scene_mode_for_lux(meta.get("Lux", 0))
 
                 # Get frame duration limits if set
                 frame_duration = meta.get("FrameDuration")
@@ -719,11 +1015,14 @@ class CameraController:
                     "ae_constraint_mode": self._ae_constraint_mode,
                     "ae_exposure_mode": self._ae_exposure_mode,
                 }
-                logger.debug(f"Camera status built: autofocus_mode={status['autofocus_mode']}, hdr_mode={status['hdr_mode']}")
+                logger.debug(
+                    "Camera status built: autofocus_mode=%s, hdr_mode=%s",
+                    status["autofocus_mode"], status["hdr_mode"],
+                )
                 return status
-            except Exception as e:
-                logger.error(f"Error retrieving camera metadata: {e}", exc_info=True)
-                raise
+        except Exception as e:
+            logger.error("Error retrieving camera metadata: %s", e, exc_info=True)
+            raise
 
     def get_capabilities(self) -> Dict[str, Any]:
         """
@@ -824,18 +1123,10 @@ class CameraController:
                     "min": -8.0,
                     "max": 8.0,
                 },
-                "supported_noise_reduction_modes": [
-                    "off", "fast", "high_quality", "minimal", "zsl"
-                ],
-                "supported_ae_constraint_modes": [
-                    "normal", "highlight", "shadows", "custom"
-                ],
-                "supported_ae_exposure_modes": [
-                    "normal", "short", "long", "custom"
-                ],
-                "supported_awb_modes": [
-                    "auto", "tungsten", "fluorescent", "indoor", "daylight", "cloudy", "custom"
-                ],
+                "supported_noise_reduction_modes": list(NOISE_REDUCTION_MODES),
+                "supported_ae_constraint_modes": list(AE_CONSTRAINT_MODES),
+                "supported_ae_exposure_modes": list(AE_EXPOSURE_MODES),
+                "supported_awb_modes": list(AWB_MODES),
                 "features": features,
                 "current_framerate": self._current_framerate,
                 "framerate_limits_by_resolution": [
@@ -859,7 +1150,10 @@ class CameraController:
                 "recommended_resolutions": self._get_recommended_resolutions(),
             }
 
-            logger.debug(f"Camera capabilities retrieved: {len(features)} features supported, is_wide={self._is_wide_camera}")
+            logger.debug(
+                "Camera capabilities retrieved: %d features supported, is_wide=%s",
+                len(features), self._is_wide_camera,
+            )
             return capabilities
 
     def _get_recommended_resolutions(self) -> list:
@@ -903,27 +1197,18 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["default", "manual", "auto", "continuous"]
-        if mode not in valid_modes:
+        if mode not in AF_MODES:
             raise InvalidParameterError(
-                f"Invalid autofocus mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid autofocus mode '{mode}'. Must be one of: {', '.join(AF_MODES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            # Map mode to libcamera AfMode values
-            af_mode_map = {
-                "default": 0,
-                "manual": 0,
-                "auto": 1,
-                "continuous": 2,
-            }
-
-            self._picam2.set_controls({"AfMode": af_mode_map[mode]})
+            self._picam2.set_controls({"AfMode": AF_MODES[mode]})
             self._autofocus_mode = mode
-            logger.info(f"Autofocus mode set to: {mode}")
+            logger.info("Autofocus mode set to: %s", mode)
 
     def set_lens_position(self, position: float) -> None:
         """
@@ -937,7 +1222,7 @@ class CameraController:
             InvalidParameterError: If position is out of range
             CameraNotAvailableError: If camera is not configured
         """
-        if position < MIN_LENS_POSITION or position > MAX_LENS_POSITION:
+        if not (MIN_LENS_POSITION <= position <= MAX_LENS_POSITION):
             raise InvalidParameterError(
                 f"lens_position must be between {MIN_LENS_POSITION} and {MAX_LENS_POSITION} (got {position})"
             )
@@ -947,7 +1232,7 @@ class CameraController:
                 raise CameraNotAvailableError("Camera not initialized")
 
             self._picam2.set_controls({"LensPosition": position})
-            logger.info(f"Lens position set to: {position}")
+            logger.info("Lens position set to: %s", position)
 
     def set_autofocus_range(self, range_mode: str) -> None:
         """
@@ -960,31 +1245,23 @@ class CameraController:
             InvalidParameterError: If range_mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_ranges = ["normal", "macro", "full"]
-        if range_mode not in valid_ranges:
+        if range_mode not in AF_RANGES:
             raise InvalidParameterError(
-                f"Invalid autofocus range '{range_mode}'. Must be one of: {', '.join(valid_ranges)}"
+                f"Invalid autofocus range '{range_mode}'. Must be one of: {', '.join(AF_RANGES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            # Map range to libcamera AfRange values
-            af_range_map = {
-                "normal": 0,
-                "macro": 1,
-                "full": 2,
-            }
-
-            self._picam2.set_controls({"AfRange": af_range_map[range_mode]})
-            logger.info(f"Autofocus range set to: {range_mode}")
+            self._picam2.set_controls({"AfRange": AF_RANGES[range_mode]})
+            logger.info("Autofocus range set to: %s", range_mode)
 
     # ---------- Snapshot/Capture ----------
 
-    def capture_snapshot(
+    def capture_snapshot_bytes(
         self, width: int = 1920, height: int = 1080, autofocus_trigger: bool = True
-    ) -> str:
+    ) -> bytes:
         """
         Capture a single JPEG image without stopping streaming.
 
@@ -994,7 +1271,7 @@ class CameraController:
             autofocus_trigger: Trigger autofocus before capture (default True)
 
         Returns:
-            str: Base64-encoded JPEG image
+            bytes: Raw JPEG image data
 
         Raises:
             CameraNotAvailableError: If camera is not configured
@@ -1011,25 +1288,45 @@ class CameraController:
                 # Capture frame
                 array = self._picam2.capture_array("main")
 
-                # Convert to PIL Image and resize if needed
-                img = Image.fromarray(array)
-                if img.size != (width, height):
-                    img = img.resize((width, height), Image.Resampling.LANCZOS)
+            except Exception as e:
+                logger.error("Error capturing snapshot: %s", e)
+                raise
 
-                # Encode to JPEG in memory
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=95)
-                buffer.seek(0)
+        # Resize and encode outside the lock; only the capture needs the camera
+        try:
+            jpeg = _encode_jpeg(array, width, height)
+        except Exception as e:
+            logger.error("Error encoding snapshot: %s", e)
+            raise
 
-                # Encode to base64
-                img_base64 = base64.b64encode(buffer.read()).decode("utf-8")
+        logger.info("Snapshot captured: %sx%s", width, height)
+        return jpeg
 
-                logger.info(f"Snapshot captured: {width}x{height}")
-                return img_base64
+    def capture_snapshot(
+        self, width: int = 1920, height: int = 1080, autofocus_trigger: bool = True
+    ) -> str:
+        """
+        Capture a single JPEG image encoded as base64.
 
-            except Exception as e:
-                logger.error(f"Error capturing snapshot: {e}")
-                raise
+        Prefer capture_snapshot_bytes() unless the image has to travel
+        inside a text payload.
+
+        Args:
+            width: Image width in pixels (default 1920)
+            height: Image height in pixels (default 1080)
+            autofocus_trigger: Trigger autofocus before capture (default True)
+
+        Returns:
+            str: Base64-encoded JPEG image
+
+        Raises:
+            CameraNotAvailableError: If camera is not configured
+        """
+        jpeg = self.capture_snapshot_bytes(width, height, autofocus_trigger)
+        # pybase64 uses SIMD kernels, much faster than stdlib for large JPEGs
+        if HAS_PYBASE64:
+            return pybase64.b64encode_as_string(jpeg)
+        return base64.b64encode(jpeg).decode("ascii")
 
     # ---------- Manual White Balance ----------
 
@@ -1045,11 +1342,11 @@ class CameraController:
             InvalidParameterError: If gains are out of reasonable range
             CameraNotAvailableError: If camera is not configured
         """
-        if red_gain < 0.5 or red_gain > 5.0:
+        if not (0.5 <= red_gain <= 5.0):
             raise InvalidParameterError(
                 f"red_gain must be between 0.5 and 5.0 (got {red_gain})"
             )
-        if blue_gain < 0.5 or blue_gain > 5.0:
+        if not (0.5 <= blue_gain <= 5.0):
             raise InvalidParameterError(
                 f"blue_gain must be between 0.5 and 5.0 (got {blue_gain})"
             )
@@ -1062,8 +1359,9 @@ class CameraController:
                 "AwbEnable": False,
                 "ColourGains": (red_gain, blue_gain),
             })
+            self._applied_awb = False
 
-            logger.info(f"Manual white balance set: R={red_gain}, B={blue_gain}")
+            logger.info("Manual white balance set: R=%s, B=%s", red_gain, blue_gain)
 
     def set_awb_preset(self, preset: str) -> None:
         """
@@ -1083,7 +1381,7 @@ class CameraController:
 
         red_gain, blue_gain = AWB_PRESETS[preset]
         self.set_manual_awb(red_gain, blue_gain)
-        logger.info(f"AWB preset '{preset}' applied: R={red_gain}, B={blue_gain}")
+        logger.info("AWB preset '%s' applied: R=%s, B=%s", preset, red_gain, blue_gain)
 
     # ---------- Image Processing ----------
 
@@ -1110,28 +1408,28 @@ class CameraController:
         controls = {}
 
         if brightness is not None:
-            if brightness < -1.0 or brightness > 1.0:
+            if not (-1.0 <= brightness <= 1.0):
                 raise InvalidParameterError(
                     f"brightness must be between -1.0 and 1.0 (got {brightness})"
                 )
             controls["Brightness"] = brightness
 
         if contrast is not None:
-            if contrast < 0.0 or contrast > 2.0:
+            if not (0.0 <= contrast <= 2.0):
                 raise InvalidParameterError(
                     f"contrast must be between 0.0 and 2.0 (got {contrast})"
                 )
             controls["Contrast"] = contrast
 
         if saturation is not None:
-            if saturation < 0.0 or saturation > 2.0:
+            if not (0.0 <= saturation <= 2.0):
                 raise InvalidParameterError(
                     f"saturation must be between 0.0 and 2.0 (got {saturation})"
                 )
             controls["Saturation"] = saturation
 
         if sharpness is not None:
-            if sharpness < 0.0 or sharpness > 16.0:
+            if not (0.0 <= sharpness <= 16.0):
                 raise InvalidParameterError(
                     f"sharpness must be between 0.0 and 16.0 (got {sharpness})"
                 )
@@ -1142,7 +1440,7 @@ class CameraController:
                 raise CameraNotAvailableError("Camera not initialized")
 
             self._picam2.set_controls(controls)
-            logger.info(f"Image processing parameters updated: {controls}")
+            logger.info("Image processing parameters updated: %s", controls)
 
     # ---------- HDR Mode ----------
 
@@ -1159,16 +1457,15 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["off", "auto", "sensor", "single-exp"]
-        if mode not in valid_modes:
+        if mode not in HDR_MODES:
             raise InvalidParameterError(
-                f"Invalid HDR mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid HDR mode '{mode}'. Must be one of: {', '.join(HDR_MODES)}"
             )
 
         # Note: HDR configuration typically requires camera reconfiguration
         # This is a simplified implementation - full HDR may need restart
         self._hdr_mode = mode
-        logger.info(f"HDR mode set to: {mode}")
+        logger.info("HDR mode set to: %s", mode)
         logger.warning("HDR mode change may require camera reconfiguration to take full effect")
 
     # ---------- ROI (Region of Interest) ----------
@@ -1212,7 +1509,7 @@ class CameraController:
                     int(height * self._picam2.sensor_resolution[1]),
                 )
             })
-            logger.info(f"ROI set: x={x}, y={y}, width={width}, height={height}")
+            logger.info("ROI set: x=%s, y=%s, width=%s, height=%s", x, y, width, height)
 
     # ---------- Exposure Limits ----------
 
@@ -1257,7 +1554,7 @@ class CameraController:
         if min_exposure_us is not None or max_exposure_us is not None:
             # Get current metadata to determine sensible defaults
             try:
-                meta = self._picam2.capture_metadata()
+                meta = self._current_metadata()
                 current_frame_duration = meta.get("FrameDuration", 33333)  # Default to ~30fps
             except Exception:
                 current_frame_duration = 33333  # Default to ~30fps if metadata unavailable
@@ -1281,8 +1578,8 @@ class CameraController:
 
             controls["FrameDurationLimits"] = (min_duration, max_duration)
             logger.info(
-                f"Setting FrameDurationLimits to constrain exposure: "
-                f"min={min_duration}µs, max={max_duration}µs"
+                "Setting FrameDurationLimits to constrain exposure: min=%sµs, max=%sµs",
+                min_duration, max_duration,
             )
 
         with self._lock:
@@ -1291,7 +1588,7 @@ class CameraController:
 
             if controls:
                 self._picam2.set_controls(controls)
-                logger.info(f"Exposure limits set via FrameDurationLimits: {controls}")
+                logger.info("Exposure limits set via FrameDurationLimits: %s", controls)
             else:
                 logger.warning("No valid exposure limits provided")
 
@@ -1314,7 +1611,7 @@ class CameraController:
             # Lens shading correction is typically controlled via tuning file
             # This is a placeholder - actual implementation may require reconfiguration
             self._lens_correction_enabled = enabled
-            logger.info(f"Lens correction {'enabled' if enabled else 'disabled'}")
+            logger.info("Lens correction %s", "enabled" if enabled else "disabled")
             logger.warning("Lens correction may require camera reconfiguration to take full effect")
 
     # ---------- Transform (Flip/Rotation) ----------
@@ -1344,7 +1641,7 @@ class CameraController:
                 raise CameraNotAvailableError("Camera not initialized")
 
             # Transform requires reconfiguration
-            logger.info(f"Transform set: hflip={hflip}, vflip={vflip}, rotation={rotation}")
+            logger.info("Transform set: hflip=%s, vflip=%s, rotation=%s", hflip, vflip, rotation)
             logger.warning("Transform changes require camera restart to take effect")
 
     # ---------- Day/Night Mode ----------
@@ -1361,10 +1658,9 @@ class CameraController:
             InvalidParameterError: If mode is invalid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["manual", "auto"]
-        if mode not in valid_modes:
+        if mode not in DAY_NIGHT_MODES:
             raise InvalidParameterError(
-                f"Invalid day/night mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid day/night mode '{mode}'. Must be one of: {', '.join(DAY_NIGHT_MODES)}"
             )
 
         if threshold_lux < 0:
@@ -1373,7 +1669,7 @@ class CameraController:
         self._day_night_mode = mode
         self._day_night_threshold_lux = threshold_lux
 
-        logger.info(f"Day/night mode set to: {mode}, threshold: {threshold_lux} lux")
+        logger.info("Day/night mode set to: %s, threshold: %s lux", mode, threshold_lux)
 
     def get_scene_mode(self) -> str:
         """
@@ -1390,19 +1686,10 @@ class CameraController:
                 raise CameraNotAvailableError("Camera not configured")
 
             try:
-                meta = self._picam2.capture_metadata()
-                lux = meta.get("Lux", 0)
-
-                if lux is None:
-                    return "unknown"
-                elif lux > 100:
-                    return "day"
-                elif lux > self._day_night_threshold_lux:
-                    return "low_light"
-                else:
-                    return "night"
+                meta = self._current_metadata()
+                return self._scene_mode_for_lux(meta.get("Lux", 0))
             except Exception as e:
-                logger.error(f"Error detecting scene mode: {e}")
+                logger.error("Error detecting scene mode: %s", e)
                 return "unknown"
 
     # ---------- New v2.1 Controls ----------
@@ -1421,7 +1708,7 @@ class CameraController:
             InvalidParameterError: If EV is out of range
             CameraNotAvailableError: If camera is not configured
         """
-        if ev < -8.0 or ev > 8.0:
+        if not (-8.0 <= ev <= 8.0):
             raise InvalidParameterError(
                 f"ExposureValue must be between -8.0 and 8.0 (got {ev})"
             )
@@ -1432,7 +1719,7 @@ class CameraController:
 
             self._picam2.set_controls({"ExposureValue": ev})
             self._exposure_value = ev  # Track current value
-            logger.info(f"Exposure value compensation set to: {ev}")
+            logger.info("Exposure value compensation set to: %s", ev)
 
     def set_noise_reduction_mode(self, mode: str) -> None:
         """
@@ -1452,28 +1739,18 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["off", "fast", "high_quality", "minimal", "zsl"]
-        if mode not in valid_modes:
+        if mode not in NOISE_REDUCTION_MODES:
             raise InvalidParameterError(
-                f"Invalid noise reduction mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid noise reduction mode '{mode}'. Must be one of: {', '.join(NOISE_REDUCTION_MODES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            # Map mode names to libcamera NoiseReductionMode enum values
-            mode_map = {
-                "off": 0,
-                "fast": 1,
-                "high_quality": 2,
-                "minimal": 3,
-                "zsl": 4,
-            }
-
-            self._picam2.set_controls({"NoiseReductionMode": mode_map[mode]})
+            self._picam2.set_controls({"NoiseReductionMode": NOISE_REDUCTION_MODES[mode]})
             self._noise_reduction_mode = mode  # Track current value
-            logger.info(f"Noise reduction mode set to: {mode}")
+            logger.info("Noise reduction mode set to: %s", mode)
 
     def set_ae_constraint_mode(self, mode: str) -> None:
         """
@@ -1495,26 +1772,18 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["normal", "highlight", "shadows", "custom"]
-        if mode not in valid_modes:
+        if mode not in AE_CONSTRAINT_MODES:
             raise InvalidParameterError(
-                f"Invalid AE constraint mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid AE constraint mode '{mode}'. Must be one of: {', '.join(AE_CONSTRAINT_MODES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            mode_map = {
-                "normal": 0,
-                "highlight": 1,
-                "shadows": 2,
-                "custom": 3,
-            }
-
-            self._picam2.set_controls({"AeConstraintMode": mode_map[mode]})
+            self._picam2.set_controls({"AeConstraintMode": AE_CONSTRAINT_MODES[mode]})
             self._ae_constraint_mode = mode  # Track current value
-            logger.info(f"AE constraint mode set to: {mode}")
+            logger.info("AE constraint mode set to: %s", mode)
 
     def set_ae_exposure_mode(self, mode: str) -> None:
         """
@@ -1535,26 +1804,18 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["normal", "short", "long", "custom"]
-        if mode not in valid_modes:
+        if mode not in AE_EXPOSURE_MODES:
             raise InvalidParameterError(
-                f"Invalid AE exposure mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid AE exposure mode '{mode}'. Must be one of: {', '.join(AE_EXPOSURE_MODES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            mode_map = {
-                "normal": 0,
-                "short": 1,
-                "long": 2,
-                "custom": 3,
-            }
-
-            self._picam2.set_controls({"AeExposureMode": mode_map[mode]})
+            self._picam2.set_controls({"AeExposureMode": AE_EXPOSURE_MODES[mode]})
             self._ae_exposure_mode = mode  # Track current value
-            logger.info(f"AE exposure mode set to: {mode}")
+            logger.info("AE exposure mode set to: %s", mode)
 
     def set_awb_mode(self, mode: str) -> None:
         """
@@ -1578,31 +1839,21 @@ class CameraController:
             InvalidParameterError: If mode is not valid
             CameraNotAvailableError: If camera is not configured
         """
-        valid_modes = ["auto", "tungsten", "fluorescent", "indoor", "daylight", "cloudy", "custom"]
-        if mode not in valid_modes:
+        if mode not in AWB_MODES:
             raise InvalidParameterError(
-                f"Invalid AWB mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid AWB mode '{mode}'. Must be one of: {', '.join(AWB_MODES)}"
             )
 
         with self._lock:
             if self._picam2 is None:
                 raise CameraNotAvailableError("Camera not initialized")
 
-            mode_map = {
-                "auto": 0,
-                "tungsten": 1,
-                "fluorescent": 2,
-                "indoor": 3,
-                "daylight": 4,
-                "cloudy": 5,
-                "custom": 7,
-            }
-
             self._picam2.set_controls({
                 "AwbEnable": True,
-                "AwbMode": mode_map[mode]
+                "AwbMode": AWB_MODES[mode]
             })
-            logger.info(f"AWB mode set to: {mode}")
+            self._applied_awb = True
+            logger.info("AWB mode set to: %s", mode)
 
     def trigger_autofocus(self) -> None:
         """
@@ -1637,14 +1888,13 @@ class CameraController:
             This only changes the mode. You need to reconfigure the camera
             (e.g., by changing resolution) for it to take effect.
         """
-        valid_modes = ["scale", "crop"]
-        if mode not in valid_modes:
+        if mode not in FOV_MODES:
             raise InvalidParameterError(
-                f"Invalid FOV mode '{mode}'. Must be one of: {', '.join(valid_modes)}"
+                f"Invalid FOV mode '{mode}'. Must be one of: {', '.join(FOV_MODES)}"
             )
 
         self._fov_mode = mode
-        logger.info(f"FOV mode set to: {mode}")
+        logger.info("FOV mode set to: %s", mode)
 
     def get_fov_mode(self) -> str:
         """
@@ -1655,139 +1905,113 @@ class CameraController:
         """
         return self._fov_mode
 
-    def set_resolution(self, width: int, height: int) -> None:
+    def validate_reconfigure(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        framerate: Optional[float] = None,
+        fov_mode: Optional[str] = None,
+    ) -> None:
         """
-        Change camera resolution by stopping and reconfiguring.
+        Check reconfigure() arguments without touching the camera.
 
-        This method stops the camera, reconfigures it with the new resolution,
-        and leaves it in a stopped state. The caller (API/streaming_manager) is
-        responsible for restarting the camera and streaming.
+        Lets callers reject a bad request before pausing streaming around
+        the actual reconfiguration.
 
         Args:
             width: New video width in pixels (64-4096)
             height: New video height in pixels (64-4096)
+            framerate: Desired framerate in fps
+            fov_mode: FOV mode - "scale" or "crop"
 
         Raises:
-            InvalidParameterError: If resolution is invalid
-            CameraNotAvailableError: If camera is not configured
+            InvalidParameterError: If a parameter is invalid
         """
-        if width < 64 or width > 4096:
+        if width is not None and not (64 <= width <= 4096):
             raise InvalidParameterError(f"width must be between 64 and 4096 (got {width})")
-        if height < 64 or height > 4096:
+        if height is not None and not (64 <= height <= 4096):
             raise InvalidParameterError(f"height must be between 64 and 4096 (got {height})")
+        if framerate is not None:
+            if framerate <= 0:
+                raise InvalidParameterError(f"framerate must be > 0 (got {framerate})")
+            if framerate > 1000:
+                raise InvalidParameterError(f"framerate must be <= 1000 (got {framerate})")
+        if fov_mode is not None and fov_mode not in FOV_MODES:
+            raise InvalidParameterError(
+                f"Invalid FOV mode '{fov_mode}'. Must be one of: {', '.join(FOV_MODES)}"
+            )
 
-        with self._lock:
-            if self._picam2 is None or not self._configured:
-                raise CameraNotAvailableError("Camera not configured")
-
-            try:
-                logger.info(f"Changing camera resolution to {width}x{height}")
-
-                # Stop camera if running
-                was_started = self._picam2.started
-                if was_started:
-                    logger.debug("Stopping camera for resolution change")
-                    self._picam2.stop()
-
-                # Build configuration dict
-                config_dict = {
-                    "main": {
-                        "size": (width, height),
-                        "format": "YUV420",
-                    },
-                    "controls": {
-                        "FrameRate": self._current_framerate,
-                        "AfMode": 2,  # Maintain continuous autofocus
-                    },
-                }
-
-                # Add sensor config based on FOV mode
-                sensor_config = self._get_sensor_config()
-                if sensor_config is not None:
-                    config_dict["sensor"] = sensor_config
-
-                # Create new video configuration with desired resolution
-                new_config = self._picam2.create_video_configuration(**config_dict)
-
-                # Apply new configuration
-                self._picam2.configure(new_config)
-
-                # Update tracked resolution
-                self._current_width = width
-                self._current_height = height
-
-                # Recalculate optimal bitrate for new resolution
-                self._current_bitrate = self._get_optimal_bitrate()
-
-                # Restart camera if it was running
-                if was_started:
-                    logger.debug("Restarting camera with new resolution")
-                    self._picam2.start()
-
-                logger.info(f"Resolution changed to {width}x{height} successfully")
-
-            except Exception as e:
-                logger.error(f"Failed to change resolution: {e}")
-                raise InvalidParameterError(f"Resolution change failed: {e}")
-
-    def set_framerate(self, requested_framerate: float) -> Dict[str, Any]:
+    def reconfigure(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        framerate: Optional[float] = None,
+        fov_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
-        Change camera framerate with intelligent limit clamping.
+        Apply resolution, framerate and FOV mode changes in a single camera cycle.
 
-        Automatically clamps the requested framerate to the maximum supported
-        by the current resolution. This provides a user-friendly API that never
-        rejects valid requests, instead applying the best possible framerate.
+        Omitted arguments keep their current values. The camera is stopped,
+        reconfigured and restarted (if it was running) exactly once, so a
+        combined change costs one 3A convergence instead of one per setting.
+        A requested framerate is clamped to the maximum supported by the
+        resulting resolution.
 
         Args:
-            requested_framerate: Desired framerate in fps (e.g., 30.0, 60.0, 120.0)
+            width: New video width in pixels (64-4096)
+            height: New video height in pixels (64-4096)
+            framerate: Desired framerate in fps
+            fov_mode: FOV mode - "scale" or "crop"
 
         Returns:
-            dict: Information about the applied framerate including:
-                - requested_framerate: What the user asked for
-                - applied_framerate: What was actually applied
-                - max_framerate_for_resolution: Maximum possible for current resolution
+            dict: Applied configuration including:
+                - requested_framerate: What the user asked for (None if unchanged)
+                - applied_framerate: Framerate now in effect
+                - max_framerate_for_resolution: Maximum possible for the resolution
                 - resolution: Current resolution (width x height)
+                - clamped: Whether the requested framerate was clamped
 
         Raises:
-            InvalidParameterError: If framerate is invalid (≤ 0 or unreasonably high)
+            InvalidParameterError: If a parameter is invalid or reconfiguration fails
             CameraNotAvailableError: If camera is not configured
         """
-        # Validate basic sanity
-        if requested_framerate <= 0:
-            raise InvalidParameterError(
-                f"framerate must be > 0 (got {requested_framerate})"
-            )
-        if requested_framerate > 1000:
-            raise InvalidParameterError(
-                f"framerate must be <= 1000 (got {requested_framerate})"
-            )
+        self.validate_reconfigure(width, height, framerate, fov_mode)
 
         with self._lock:
             if self._picam2 is None or not self._configured:
                 raise CameraNotAvailableError("Camera not configured")
 
-            # Calculate max framerate for current resolution
-            max_fps = calculate_max_framerate(self._current_width, self._current_height)
+            previous_fov_mode = self._fov_mode
 
-            # Clamp to maximum (this is the intelligent part!)
-            applied_framerate = min(requested_framerate, max_fps)
+            new_width = self._current_width if width is None else width
+            new_height = self._current_height if height is None else height
+
+            # Clamp a requested framerate to the maximum for the new resolution
+            max_fps = calculate_max_framerate(new_width, new_height)
+            if framerate is None:
+                applied_framerate = self._current_framerate
+            else:
+                applied_framerate = min(framerate, max_fps)
 
             try:
+                if fov_mode is not None:
+                    self.set_fov_mode(fov_mode)
+
                 logger.info(
-                    f"Framerate change requested: {requested_framerate}fps "
-                    f"(max for {self._current_width}x{self._current_height}: {max_fps}fps)"
+                    "Reconfiguring camera: %dx%d @ %sfps (fov_mode=%s)",
+                    new_width, new_height, applied_framerate, self._fov_mode,
                 )
 
                 # Stop camera if running
                 was_started = self._picam2.started
                 if was_started:
-                    logger.debug("Stopping camera for framerate change")
+                    logger.debug("Stopping camera for reconfiguration")
                     self._picam2.stop()
 
                 # Build configuration dict
                 config_dict = {
                     "main": {
-                        "size": (self._current_width, self._current_height),
+                        "size": (new_width, new_height),
                         "format": "YUV420",
                     },
                     "controls": {
@@ -1801,33 +2025,74 @@ class CameraController:
                 if sensor_config is not None:
                     config_dict["sensor"] = sensor_config
 
-                # Create new video configuration with new framerate
+                # Create and apply the new video configuration
                 new_config = self._picam2.create_video_configuration(**config_dict)
-
-                # Apply new configuration
                 self._picam2.configure(new_config)
+                self._forget_applied_controls()
 
-                # Update tracked framerate
+                # Update tracked configuration
+                self._current_width = new_width
+                self._current_height = new_height
                 self._current_framerate = applied_framerate
 
-                # Recalculate optimal bitrate for new framerate
+                # Recalculate optimal bitrate for new resolution/framerate
                 self._current_bitrate = self._get_optimal_bitrate()
 
                 # Restart camera if it was running
                 if was_started:
-                    logger.debug("Restarting camera with new framerate")
+                    logger.debug("Restarting camera with new configuration")
                     self._picam2.start()
 
-                logger.info(f"Framerate changed to {applied_framerate}fps successfully")
+                logger.info("Camera reconfigured successfully")
 
                 return {
-                    "requested_framerate": requested_framerate,
+                    "requested_framerate": framerate,
                     "applied_framerate": applied_framerate,
                     "max_framerate_for_resolution": max_fps,
-                    "resolution": f"{self._current_width}x{self._current_height}",
-                    "clamped": requested_framerate > max_fps,
+                    "resolution": f"{new_width}x{new_height}",
+                    "clamped": framerate is not None and framerate > max_fps,
                 }
 
             except Exception as e:
-                logger.error(f"Failed to change framerate: {e}")
-                raise InvalidParameterError(f"Framerate change failed: {e}")
+                # Don't report a FOV mode that was never applied
+                self._fov_mode = previous_fov_mode
+                logger.error("Failed to reconfigure camera: %s", e)
+                raise InvalidParameterError(f"Camera reconfiguration failed: {e}")
+
+    def set_resolution(self, width: int, height: int) -> None:
+        """
+        Change camera resolution by stopping and reconfiguring.
+
+        Args:
+            width: New video width in pixels (64-4096)
+            height: New video height in pixels (64-4096)
+
+        Raises:
+            InvalidParameterError: If resolution is invalid
+            CameraNotAvailableError: If camera is not configured
+        """
+        self.reconfigure(width=width, height=height)
+
+    def set_framerate(self, requested_framerate: float) -> Dict[str, Any]:
+        """
+        Change camera framerate with intelligent limit clamping.
+
+        Automatically clamps the requested framerate to the maximum supported
+        by the current resolution. This provides a user-friendly API that never
+        rejects valid requests, instead applying the best possible framerate.
+
+        Args:
+            requested_framerate: Desired framerate in fps (e.g., 30.0, 60.0, 120.0)
+
+        Returns:
+            dict: Information about the applied framerate including:
+                - requested_framerate: What the user asked for
+                - applied_framerate: What was actually applied
+                - max_framerate_for_resolution: Maximum possible for current resolution
+                - resolution: Current resolution (width x height)
+
+        Raises:
+            InvalidParameterError: If framerate is invalid (≤ 0 or unreasonably high)
+            CameraNotAvailableError: If camera is not configured
+        """
+        return self.reconfigure(framerate=requested_framerate)
@@ -26,7 +26,11 @@ class CameraConfig(BaseSettings):
     - CAMERA_API_KEY: API key for authentication (optional, disables auth if not set)
     - CAMERA_HOST: API server host
     - CAMERA_PORT: API server port
+    - CAMERA_KEEP_ALIVE_TIMEOUT: Seconds to keep idle HTTP connections open
+    - CAMERA_SYSTEM_STATUS_TTL: Seconds a system status reading is reused (0 disables)
     - CAMERA_LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    - CAMERA_LOG_FILE: Also write logs to this file (optional)
+    - CAMERA_ACCESS_LOG: Log every HTTP request (true/false)
     """
 
     model_config = SettingsConfigDict(
@@ -102,6 +106,18 @@ class CameraConfig(BaseSettings):
         ge=1,
         le=65535,
     )
+    keep_alive_timeout: int = Field(
+        default=30,
+        description="Seconds to keep idle HTTP keep-alive connections open",
+        ge=1,
+        le=3600,
+    )
+    system_status_ttl: float = Field(
+        default=1.0,
+        description="Seconds a /v1/system/status reading is shared between requests",
+        ge=0.0,
+        le=60.0,
+    )
 
     # Security
     api_key: str | None = Field(
@@ -114,6 +130,14 @@ class CameraConfig(BaseSettings):
         default="INFO",
         description="Logging level",
     )
+    log_file: str | None = Field(
+        default=None,
+        description="Path of a file to write logs to, in addition to stderr",
+    )
+    access_log: bool = Field(
+        default=False,
+        description="Emit a uvicorn access log line for every HTTP request",
+    )
 
     @field_validator("log_level")
     @classmethod
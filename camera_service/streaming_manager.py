@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from threading import RLock
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from picamera2.encoders import H264Encoder
 from picamera2.outputs import FfmpegOutput
@@ -20,6 +20,8 @@ from camera_service.exceptions import StreamingError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class StreamingManager:
     """
@@ -57,7 +59,7 @@ class StreamingManager:
                 return
 
             try:
-                logger.info(f"Starting RTSP streaming to {CONFIG.rtsp_url}")
+                logger.info("Starting RTSP streaming to %s", CONFIG.rtsp_url)
 
                 picam2 = self._camera.picam2
 
@@ -83,12 +85,12 @@ class StreamingManager:
                 self._streaming = True
 
                 logger.info(
-                    f"Streaming started successfully to {CONFIG.rtsp_url} "
-                    f"(bitrate={bitrate / 1_000_000:.1f} Mbps)"
+                    "Streaming started successfully to %s (bitrate=%.1f Mbps)",
+                    CONFIG.rtsp_url, bitrate / 1_000_000,
                 )
 
             except Exception as e:
-                logger.error(f"Failed to start streaming: {e}")
+                logger.error("Failed to start streaming: %s", e)
                 # Cleanup on failure
                 self._encoder = None
                 self._output = None
@@ -115,7 +117,7 @@ class StreamingManager:
                 logger.info("Streaming stopped successfully")
 
             except Exception as e:
-                logger.error(f"Error stopping recording: {e}")
+                logger.error("Error stopping recording: %s", e)
                 # Continue with cleanup even if stop fails
 
             finally:
@@ -126,18 +128,73 @@ class StreamingManager:
                         # For now, just clear the reference
                         self._output = None
                     except Exception as e:
-                        logger.warning(f"Error cleaning up output: {e}")
+                        logger.warning("Error cleaning up output: %s", e)
 
                 self._encoder = None
                 self._streaming = False
                 logger.debug("Streaming resources cleaned up")
 
+    def reconfigure(self, apply: Callable[[], T], resume: bool = True) -> T:
+        """
+        Run a camera reconfiguration with streaming paused around it.
+
+        If streaming is active it is stopped, ``apply`` is called, and
+        streaming is started again (when ``resume`` is true) with an encoder
+        sized for the new configuration. The whole sequence runs under the
+        manager's lock, so a concurrent start()/stop() cannot land in the
+        middle of it, and callers need a single threadpool hop instead of
+        three.
+
+        The H.264 encoder is bound to the stream size it was started with,
+        so it is recreated rather than kept across the change. If ``apply``
+        raises, streaming is still restarted (on whatever configuration the
+        camera is left with) before the error propagates, so a failed
+        change does not take the RTSP stream down.
+
+        Args:
+            apply: Callable performing the camera reconfiguration
+            resume: Restart streaming afterwards if it was active
+
+        Returns:
+            Whatever ``apply`` returns
+
+        Raises:
+            StreamingError: If streaming fails to restart after a
+                successful change
+        """
+        with self._lock:
+            was_streaming = self._streaming
+            if was_streaming:
+                logger.info("Pausing streaming for camera reconfiguration")
+                self.stop()
+
+            try:
+                result = apply()
+            except Exception:
+                if was_streaming and resume:
+                    logger.info("Resuming streaming after failed camera reconfiguration")
+                    try:
+                        self.start()
+                    except StreamingError as e:
+                        # Keep the reconfiguration error as the one reported
+                        logger.error("Could not resume streaming: %s", e)
+                raise
+
+            if was_streaming and resume:
+                logger.info("Resuming streaming after camera reconfiguration")
+                self.start()
+
+            return result
+
     def is_streaming(self) -> bool:
         """
         Check if streaming is currently active.
 
+        Lock-free: _streaming is a plain bool only written under the lock by
+        start()/stop(), and reading it is atomic. Status and health polls
+        therefore never wait behind an encoder start or a reconfiguration.
+
         Returns:
             bool: True if streaming, False otherwise
         """
-        with self._lock:
-            return self._streaming
+        return self._streaming
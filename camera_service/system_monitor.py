@@ -22,9 +22,15 @@ logger = logging.getLogger(__name__)
 class SystemMonitor:
     """Monitor system health metrics on Raspberry Pi."""
 
-    def __init__(self):
-        """Initialize system monitor."""
-        self._start_time = time.time()
+    def __init__(self, start_time: Optional[float] = None):
+        """
+        Initialize system monitor.
+
+        Args:
+            start_time: Service start timestamp (time.time()) used for the
+                service uptime; defaults to now
+        """
+        self._start_time = start_time if start_time is not None else time.time()
         self._boot_time = psutil.boot_time() if HAS_PSUTIL else None
 
         # Check if psutil is available
@@ -63,7 +69,7 @@ class SystemMonitor:
                     "status": self._get_temp_status(temp_c)
                 }
         except Exception as e:
-            logger.debug(f"Failed to read temperature from thermal zone: {e}")
+            logger.debug("Failed to read temperature from thermal zone: %s", e)
 
         # Fallback: try vcgencmd (Pi-specific)
         try:
@@ -82,7 +88,7 @@ class SystemMonitor:
                     "status": self._get_temp_status(temp_c)
                 }
         except Exception as e:
-            logger.debug(f"Failed to read temperature from vcgencmd: {e}")
+            logger.debug("Failed to read temperature from vcgencmd: %s", e)
 
         return None
 
@@ -117,7 +123,7 @@ class SystemMonitor:
                 "cores": cpu_count
             }
         except Exception as e:
-            logger.debug(f"Failed to get CPU stats: {e}")
+            logger.debug("Failed to get CPU stats: %s", e)
             return None
 
     def _get_memory_stats(self) -> Optional[Dict[str, Any]]:
@@ -134,7 +140,7 @@ class SystemMonitor:
                 "percent": round(mem.percent, 1)
             }
         except Exception as e:
-            logger.debug(f"Failed to get memory stats: {e}")
+            logger.debug("Failed to get memory stats: %s", e)
             return None
 
     def _get_network_stats(self) -> Optional[Dict[str, Any]]:
@@ -163,7 +169,7 @@ class SystemMonitor:
 
             return stats
         except Exception as e:
-            logger.debug(f"Failed to get network stats: {e}")
+            logger.debug("Failed to get network stats: %s", e)
             return None
 
     def _get_wifi_signal(self) -> Optional[Dict[str, Any]]:
@@ -204,7 +210,7 @@ class SystemMonitor:
                         "status": self._get_wifi_status(signal_dbm)
                     }
         except Exception as e:
-            logger.debug(f"Failed to get WiFi signal: {e}")
+            logger.debug("Failed to get WiFi signal: %s", e)
 
         return None
 
@@ -236,7 +242,7 @@ class SystemMonitor:
                     if interface != 'lo':
                         return interface
         except Exception as e:
-            logger.debug(f"Failed to get active interface: {e}")
+            logger.debug("Failed to get active interface: %s", e)
 
         return None
 
@@ -254,7 +260,7 @@ class SystemMonitor:
                 "percent": round(disk.percent, 1)
             }
         except Exception as e:
-            logger.debug(f"Failed to get disk stats: {e}")
+            logger.debug("Failed to get disk stats: %s", e)
             return None
 
     def _get_uptime(self) -> Dict[str, Any]:
@@ -294,6 +300,6 @@ class SystemMonitor:
                     "raw_value": throttled_hex
                 }
         except Exception as e:
-            logger.debug(f"Failed to get throttle status: {e}")
+            logger.debug("Failed to get throttle status: %s", e)
 
         return None
@@ -1,7 +1,14 @@
 """
 Main entry point for Pi Camera Service.
 
-Runs the FastAPI application using uvicorn with configuration from CONFIG.
+Runs the FastAPI application using uvicorn with configuration from CONFIG,
+on the uvloop event loop with the httptools HTTP parser. Idle connections
+are kept open for CONFIG.keep_alive_timeout seconds so clients can send a
+burst of control calls over one connection. Per-request access logging
+is off unless CONFIG.access_log is set.
+
+A single worker process is used on purpose: the camera can only be opened
+by one process at a time.
 """
 
 import uvicorn
@@ -16,4 +23,8 @@ if __name__ == "__main__":
         port=CONFIG.port,
         reload=False,
         log_level=CONFIG.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=CONFIG.keep_alive_timeout,
+        access_log=CONFIG.access_log,
     )
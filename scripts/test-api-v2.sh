@@ -75,7 +75,7 @@ echo ""
 
 # Snapshot capture
 echo -e "${BLUE}[6] Testing snapshot capture (this will take a moment)...${NC}"
-SNAPSHOT_RESPONSE=$(api_call POST "/v1/camera/snapshot" '{"width": 640, "height": 480, "autofocus_trigger": true}')
+SNAPSHOT_RESPONSE=$(api_call POST "/v1/camera/snapshot?encoding=base64" '{"width": 640, "height": 480, "autofocus_trigger": true}')
 if echo "$SNAPSHOT_RESPONSE" | jq -e '.image_base64' > /dev/null 2>&1; then
     IMAGE_SIZE=$(echo "$SNAPSHOT_RESPONSE" | jq -r '.image_base64' | wc -c)
     echo -e "${GREEN}✓ Snapshot captured (base64 size: $IMAGE_SIZE bytes)${NC}"
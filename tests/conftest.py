@@ -24,6 +24,9 @@ def mock_picamera2():
         {"Model": "imx708", "Location": 2, "Rotation": 0}
     ]
 
+    # Mock sensor properties (IMX708)
+    mock.sensor_resolution = (4608, 2592)
+
     # Mock configuration methods
     mock.create_video_configuration.return_value = {
         "main": {"size": (1920, 1080), "format": "YUV420"},
@@ -134,8 +137,11 @@ def client_no_auth(monkeypatch, mock_picamera2_class):
     import camera_service.config
     importlib.reload(camera_service.config)
 
-    from camera_service.api import app
-    return TestClient(app)
+    # The API module derives its auth settings from CONFIG at import time
+    import camera_service.api
+    importlib.reload(camera_service.api)
+
+    return TestClient(camera_service.api.app)
 
 
 @pytest.fixture
@@ -154,8 +160,26 @@ def client_with_auth(monkeypatch, mock_picamera2_class, test_config):
     import camera_service.config
     importlib.reload(camera_service.config)
 
-    from camera_service.api import app
-    return TestClient(app)
+    # The API module derives its auth settings from CONFIG at import time
+    import camera_service.api
+    importlib.reload(camera_service.api)
+
+    return TestClient(camera_service.api.app)
+
+
+@pytest.fixture
+def client_running(client_no_auth):
+    """
+    Create a FastAPI test client with the application lifespan running.
+
+    The camera is configured and streaming is started as on a real
+    service startup, and torn down again after the test.
+
+    Returns:
+        TestClient: Test client with authentication disabled
+    """
+    with client_no_auth as client:
+        yield client
 
 
 @pytest.fixture
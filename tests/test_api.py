@@ -5,9 +5,20 @@ Tests all API endpoints including authentication, error handling,
 and response models.
 """
 
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
+from camera_service.exceptions import (
+    CameraError,
+    CameraNotAvailableError,
+    ConfigurationError,
+    InvalidParameterError,
+    StreamingError,
+)
+
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
@@ -40,6 +51,47 @@ class TestCameraStatusEndpoint:
         assert "auto_exposure" in data
         assert "streaming" in data
 
+    def test_get_status_reflects_control_change(self, client_running):
+        """Test that status read right after a setter shows the new value."""
+        response = client_running.get("/v1/camera/status")
+        assert response.json()["auto_exposure"] is True
+
+        response = client_running.post("/v1/camera/auto_exposure", json={"enabled": False})
+        assert response.status_code == 200
+
+        response = client_running.get("/v1/camera/status")
+        assert response.json()["auto_exposure"] is False
+
+    def test_get_status_history(self, client_running):
+        """Test that recent frame metadata is returned oldest first."""
+        from unittest.mock import MagicMock
+
+        import camera_service.api as api
+
+        response = client_running.get("/v1/camera/status/history")
+        assert response.status_code == 200
+        assert response.json() == {"frames": []}
+
+        for lux in (10.0, 20.0):
+            request = MagicMock()
+            request.get_metadata.return_value = {
+                "Lux": lux,
+                "ExposureTime": 10000,
+                "AnalogueGain": 2.0,
+                "ColourTemperature": 4500.0,
+            }
+            api.camera_controller._store_frame_metadata(request)
+
+        response = client_running.get("/v1/camera/status/history")
+
+        assert response.status_code == 200
+        frames = response.json()["frames"]
+        assert [frame["lux"] for frame in frames] == [10.0, 20.0]
+        assert frames[0]["exposure_us"] == 10000
+        assert frames[0]["analogue_gain"] == 2.0
+        assert frames[0]["colour_temperature"] == 4500.0
+        assert frames[0]["age_s"] >= frames[1]["age_s"] >= 0
+
     def test_get_status_with_auth(self, client_with_auth, auth_headers):
         """Test that status endpoint requires authentication when configured."""
         # Without auth header should fail
@@ -198,6 +250,292 @@ class TestStreamingEndpoints:
         assert response.status_code == 200
 
 
+class TestCapabilitiesEndpoint:
+    """Test camera capabilities endpoint."""
+
+    def test_gzip_and_identity_have_distinct_etags(self, client_running):
+        """Test that the compressed variant does not share the strong ETag."""
+        gzip_response = client_running.get(
+            "/v1/camera/capabilities", headers={"Accept-Encoding": "gzip"}
+        )
+        identity_response = client_running.get(
+            "/v1/camera/capabilities", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert gzip_response.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in identity_response.headers
+        identity_etag = identity_response.headers["etag"]
+        assert gzip_response.headers["etag"] == identity_etag[:-1] + '-gz"'
+
+    def test_revalidate_gzip_etag(self, client_running):
+        """Test that either ETag form revalidates to a 304."""
+        gzip_etag = client_running.get(
+            "/v1/camera/capabilities", headers={"Accept-Encoding": "gzip"}
+        ).headers["etag"]
+
+        response = client_running.get(
+            "/v1/camera/capabilities",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == gzip_etag
+
+        response = client_running.get(
+            "/v1/camera/capabilities",
+            headers={"Accept-Encoding": "identity", "If-None-Match": "W/" + gzip_etag},
+        )
+        assert response.status_code == 304
+
+
+class TestFovModeEndpoint:
+    """Test FOV mode endpoint."""
+
+    def test_set_fov_mode_waits_for_reconfiguration(self, monkeypatch):
+        """Test that the mode is not changed while a reconfiguration runs."""
+        from unittest.mock import MagicMock
+
+        import camera_service.api as api
+        from camera_service.api import FovModeRequest, set_fov_mode
+
+        lock = asyncio.Lock()
+        monkeypatch.setattr(api, "_reconfiguration_lock", lock)
+        camera = MagicMock()
+
+        async def scenario():
+            async with lock:
+                task = asyncio.create_task(set_fov_mode(FovModeRequest(mode="crop"), camera))
+                await asyncio.sleep(0)
+                camera.set_fov_mode.assert_not_called()
+            response = await task
+            camera.set_fov_mode.assert_called_once_with("crop")
+            return response
+
+        response = asyncio.run(scenario())
+
+        assert response.status_code == 200
+        assert json.loads(response.body)["mode"] == "crop"
+
+
+class TestResolutionEndpoint:
+    """Test resolution change endpoint."""
+
+    def test_set_resolution_success(self, client_running, mock_picamera2):
+        """Test changing resolution keeps streaming active."""
+        import camera_service.api as api
+
+        response = client_running.post(
+            "/v1/camera/resolution",
+            json={"width": 1280, "height": 720},
+        )
+
+        assert response.status_code == 200
+        assert api.streaming_manager.is_streaming() is True
+
+    def test_invalid_fov_mode_keeps_streaming(self, client_running, mock_picamera2):
+        """Test that a rejected request does not pause the stream."""
+        import camera_service.api as api
+
+        mock_picamera2.stop_recording.reset_mock()
+
+        response = client_running.post(
+            "/v1/camera/resolution",
+            json={"width": 1280, "height": 720, "fov_mode": "bogus"},
+        )
+
+        assert response.status_code == 422
+        assert "Invalid FOV mode" in response.json()["detail"]
+        assert api.streaming_manager.is_streaming() is True
+        mock_picamera2.stop_recording.assert_not_called()
+
+
+class TestSnapshotEndpoint:
+    """Test snapshot capture endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def _frame(self, mock_picamera2):
+        """Make the mock camera return a real RGB frame."""
+        import numpy as np
+
+        mock_picamera2.capture_array.return_value = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    def test_snapshot_returns_raw_jpeg(self, client_running):
+        """Test that the default response is the raw JPEG with size headers."""
+        response = client_running.post(
+            "/v1/camera/snapshot",
+            json={"width": 640, "height": 480, "autofocus_trigger": False},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["X-Image-Width"] == "640"
+        assert response.headers["X-Image-Height"] == "480"
+        assert response.content[:2] == b"\xff\xd8"
+
+    def test_snapshot_base64_encoding(self, client_running):
+        """Test that ?encoding=base64 returns the legacy JSON body."""
+        import base64
+
+        response = client_running.post(
+            "/v1/camera/snapshot?encoding=base64",
+            json={"width": 640, "height": 480, "autofocus_trigger": False},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["width"] == 640
+        assert data["height"] == 480
+        assert base64.b64decode(data["image_base64"])[:2] == b"\xff\xd8"
+
+
+class TestBatchEndpoint:
+    """Test batched control commands."""
+
+    def test_batch_exposure_and_awb_ops(self, client_running, mock_picamera2):
+        """Test that the exposure and AWB endpoints are available as batch ops."""
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "auto_exposure", "params": {"enabled": False}},
+                {"op": "manual_exposure", "params": {"exposure_us": 10000, "gain": 2.0}},
+                {"op": "awb", "params": {"enabled": False}},
+            ]},
+        )
+
+        assert response.status_code == 200
+        assert [r["ok"] for r in response.json()["results"]] == [True, True, True]
+        mock_picamera2.set_controls.assert_any_call({
+            "AeEnable": False,
+            "ExposureTime": 10000,
+            "AnalogueGain": 2.0,
+        })
+        mock_picamera2.set_controls.assert_called_with({"AwbEnable": False})
+
+    def test_batch_all_succeed(self, client_running):
+        """Test that a fully applied batch returns 200 with per-item results."""
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "awb_preset", "params": {"preset": "daylight_noir"}},
+                {"op": "exposure_value", "params": {"ev": 0.5}},
+            ]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["results"] == [
+            {"op": "awb_preset", "ok": True, "error": None},
+            {"op": "exposure_value", "ok": True, "error": None},
+        ]
+
+    def test_batch_partial_failure(self, client_running):
+        """Test that a failing item yields 207 and leaves streaming active."""
+        import camera_service.api as api
+
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "resolution", "params": {"width": 1280, "height": 720}},
+                {"op": "awb_preset", "params": {"preset": "nope"}},
+                {"op": "exposure_value", "params": {"ev": 0.5}},
+            ]},
+        )
+
+        assert response.status_code == 207
+        data = response.json()
+        assert data["status"] == "partial"
+        assert [r["ok"] for r in data["results"]] == [True, False, True]
+        assert "Invalid AWB preset" in data["results"][1]["error"]
+        assert api.streaming_manager.is_streaming() is True
+
+    def test_batch_unknown_op(self, client_running, mock_picamera2):
+        """Test that an unknown op is rejected, naming the item index."""
+        mock_picamera2.set_controls.reset_mock()
+
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "exposure_value", "params": {"ev": 0.5}},
+                {"op": "bogus"},
+            ]},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "items[1]: unknown operation 'bogus'"
+        mock_picamera2.set_controls.assert_not_called()
+
+    def test_batch_params_validation_error(self, client_running):
+        """Test that invalid params are reported at the item's params location."""
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "exposure_value", "params": {"ev": 0.5}},
+                {"op": "exposure_value", "params": {"ev": 20.0}},
+            ]},
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body", "items", 1, "params", "ev"]
+
+    def test_batch_resolution_and_framerate_single_configure(self, client_running, mock_picamera2):
+        """Test that resolution and framerate share one camera reconfiguration."""
+        mock_picamera2.configure.reset_mock()
+
+        response = client_running.post(
+            "/v1/camera/batch",
+            json={"items": [
+                {"op": "resolution", "params": {"width": 1280, "height": 720}},
+                {"op": "framerate", "params": {"framerate": 60}},
+            ]},
+        )
+
+        assert response.status_code == 200
+        mock_picamera2.configure.assert_called_once()
+        config = mock_picamera2.create_video_configuration.call_args.kwargs
+        assert config["main"]["size"] == (1280, 720)
+        assert config["controls"]["FrameRate"] == 60
+
+
+class TestControlEndpoints:
+    """Test endpoints generated by _control_endpoint."""
+
+    def test_exposure_value(self, client_running, mock_picamera2):
+        """Test that a generated endpoint applies the control."""
+        response = client_running.post("/v1/camera/exposure_value", json={"ev": 0.5})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        mock_picamera2.set_controls.assert_called_with({"ExposureValue": 0.5})
+
+    def test_exposure_value_request_body_schema(self, client_no_auth):
+        """Test that a generated endpoint documents its request model."""
+        schema = client_no_auth.get("/openapi.json").json()
+        operation = schema["paths"]["/v1/camera/exposure_value"]["post"]
+
+        body = operation["requestBody"]["content"]["application/json"]["schema"]
+        assert body["$ref"] == "#/components/schemas/ExposureValueRequest"
+        assert operation["requestBody"]["required"] is True
+
+    def test_dependency_override_applies(self, client_no_auth):
+        """Test that generated endpoints resolve the camera via get_camera_controller."""
+        from unittest.mock import MagicMock
+
+        from camera_service.api import app, get_camera_controller
+
+        camera = MagicMock()
+        app.dependency_overrides[get_camera_controller] = lambda: camera
+        try:
+            response = client_no_auth.post("/v1/camera/exposure_value", json={"ev": -1.0})
+        finally:
+            app.dependency_overrides.pop(get_camera_controller)
+
+        assert response.status_code == 200
+        camera.set_exposure_value.assert_called_once_with(-1.0)
+
+
 class TestAuthentication:
     """Test API authentication."""
 
@@ -231,3 +569,40 @@ class TestAuthentication:
         """Test that health endpoint bypasses authentication."""
         response = client_with_auth.get("/health")
         assert response.status_code == 200
+
+    def test_openapi_declares_api_key_scheme(self, client_with_auth):
+        """Test that /docs can offer Authorize for the X-API-Key header."""
+        schema = client_with_auth.get("/openapi.json").json()
+
+        assert schema["components"]["securitySchemes"]["APIKeyHeader"] == {
+            "type": "apiKey",
+            "in": "header",
+            "name": "X-API-Key",
+        }
+        assert schema["paths"]["/v1/camera/status"]["get"]["security"] == [{"APIKeyHeader": []}]
+        assert "security" not in schema["paths"]["/health"]["get"]
+
+
+class TestExceptionHandlers:
+    """Test translation of camera exceptions into HTTP responses."""
+
+    @pytest.mark.parametrize(
+        "exc, expected_status, expected_detail",
+        [
+            (InvalidParameterError("gain must be <= 16.0"), 422, "gain must be <= 16.0"),
+            (CameraNotAvailableError("no camera"), 503, "Camera is not available"),
+            (StreamingError("encoder failed"), 500, "Streaming operation failed"),
+            (ConfigurationError("bad tuning"), 500, "Camera operation failed"),
+            (CameraError("boom"), 500, "Camera operation failed"),
+        ],
+    )
+    def test_camera_errors_return_json_responses(
+        self, client_no_auth, exc, expected_status, expected_detail
+    ):
+        """Test that each camera exception maps to its status code and detail."""
+        from camera_service.api import camera_error_handler
+
+        response = asyncio.run(camera_error_handler(None, exc))
+
+        assert response.status_code == expected_status
+        assert json.loads(response.body) == {"detail": expected_detail}
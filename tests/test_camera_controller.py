@@ -8,7 +8,7 @@ white balance, and error handling with mocked Picamera2.
 import pytest
 from unittest.mock import MagicMock
 
-from camera_service.camera_controller import CameraController, MAX_EXPOSURE_US, MIN_EXPOSURE_US, MAX_GAIN, MIN_GAIN
+from camera_service.camera_controller import CameraController, MAX_EXPOSURE_US, MIN_EXPOSURE_US, MAX_GAIN, MIN_GAIN, METADATA_HISTORY_SIZE
 from camera_service.exceptions import (
     CameraNotAvailableError,
     ConfigurationError,
@@ -36,6 +36,17 @@ class TestCameraControllerInit:
         mock_picamera2.configure.assert_called_once()
         mock_picamera2.create_video_configuration.assert_called_once()
 
+    def test_configure_applies_initial_controls_once(self, mock_picamera2_class, mock_picamera2):
+        """Test that initial AE/AWB controls are sent in a single call."""
+        controller = CameraController()
+        controller.configure()
+
+        mock_picamera2.set_controls.assert_called_once_with({
+            "AeEnable": True,
+            "ExposureTime": 0,
+            "AwbEnable": True,
+        })
+
     def test_configure_idempotent(self, mock_picamera2_class, mock_picamera2):
         """Test that configure can be called multiple times safely."""
         controller = CameraController()
@@ -56,6 +67,15 @@ class TestCameraControllerInit:
         with pytest.raises(CameraNotAvailableError):
             controller.configure()
 
+    def test_camera_enumerated_once(self, mock_picamera2_class, mock_picamera2):
+        """Test that init and configure share one camera enumeration."""
+        mock_picamera2.global_camera_info.reset_mock()
+
+        controller = CameraController()
+        controller.configure()
+
+        mock_picamera2.global_camera_info.assert_called_once()
+
     def test_configure_failure(self, mock_picamera2_class, mock_picamera2):
         """Test configuration failure handling."""
         mock_picamera2.configure.side_effect = Exception("Hardware error")
@@ -88,6 +108,29 @@ class TestCameraControllerExposure:
         })
         assert camera_controller._auto_exposure is False
 
+    def test_set_auto_exposure_unchanged_skips_set_controls(self, camera_controller, mock_picamera2):
+        """Test repeating the same AE state sends controls only once."""
+        camera_controller.set_auto_exposure(True)
+        camera_controller.set_auto_exposure(True)
+        camera_controller.set_auto_exposure(True)
+
+        ae_calls = [
+            c for c in mock_picamera2.set_controls.call_args_list
+            if c.args == ({"AeEnable": True, "ExposureTime": 0},)
+        ]
+        # configure() sends AE batched with AWB; only the first explicit call matches
+        assert len(ae_calls) == 1
+
+    def test_set_manual_exposure_after_auto_is_sent(self, camera_controller, mock_picamera2):
+        """Test that switching back to the same manual values is not skipped."""
+        camera_controller.set_manual_exposure(exposure_us=10000, gain=2.0)
+        camera_controller.set_auto_exposure(True)
+        mock_picamera2.set_controls.reset_mock()
+
+        camera_controller.set_manual_exposure(exposure_us=10000, gain=2.0)
+
+        mock_picamera2.set_controls.assert_called_once()
+
     def test_set_manual_exposure_valid(self, camera_controller, mock_picamera2):
         """Test setting valid manual exposure parameters."""
         camera_controller.set_manual_exposure(exposure_us=10000, gain=2.0)
@@ -137,6 +180,16 @@ class TestCameraControllerExposure:
         camera_controller.set_manual_exposure(exposure_us=MAX_EXPOSURE_US, gain=MAX_GAIN)
         mock_picamera2.set_controls.assert_called()
 
+    def test_set_manual_exposure_clamp(self, camera_controller, mock_picamera2):
+        """Test that clamp=True pins out-of-range values to the limits."""
+        camera_controller.set_manual_exposure(exposure_us=2_000_000, gain=0.5, clamp=True)
+
+        mock_picamera2.set_controls.assert_called_with({
+            "AeEnable": False,
+            "ExposureTime": MAX_EXPOSURE_US,
+            "AnalogueGain": MIN_GAIN,
+        })
+
 
 class TestCameraControllerAWB:
     """Test auto white balance control."""
@@ -157,6 +210,22 @@ class TestCameraControllerAWB:
             "AwbEnable": False,
         })
 
+    def test_set_awb_unchanged_skips_set_controls(self, camera_controller, mock_picamera2):
+        """Test repeating the same AWB state sends controls only once."""
+        camera_controller.set_awb(False)
+        mock_picamera2.set_controls.reset_mock()
+
+        camera_controller.set_awb(False)
+
+        mock_picamera2.set_controls.assert_not_called()
+
+    def test_set_manual_awb_rejects_nan(self, camera_controller, mock_picamera2):
+        """Test that NaN gains fail the range check instead of slipping through."""
+        with pytest.raises(InvalidParameterError):
+            camera_controller.set_manual_awb(float("nan"), 1.5)
+
+        mock_picamera2.set_controls.assert_called_once()  # configure() only
+
 
 class TestCameraControllerStatus:
     """Test status retrieval."""
@@ -187,6 +256,55 @@ class TestCameraControllerStatus:
         assert status["analogue_gain"] is None
         assert status["colour_temperature"] is None
 
+    def test_get_status_uses_latest_frame_metadata(self, camera_controller, mock_picamera2):
+        """Test that status reads the metadata published by post_callback."""
+        assert mock_picamera2.post_callback == camera_controller._store_frame_metadata
+
+        request = MagicMock()
+        request.get_metadata.return_value = {"Lux": 5.0, "ExposureTime": 20000}
+        camera_controller._store_frame_metadata(request)
+
+        status = camera_controller.get_status()
+
+        assert status["lux"] == 5.0
+        assert status["exposure_us"] == 20000
+        assert status["scene_mode"] == "night"
+        mock_picamera2.capture_metadata.assert_not_called()
+
+    def test_get_status_history(self, camera_controller):
+        """Test that the most recent frames' metadata is kept, oldest first."""
+        assert camera_controller.get_status_history() == []
+
+        for lux in range(METADATA_HISTORY_SIZE + 2):
+            request = MagicMock()
+            request.get_metadata.return_value = {"Lux": float(lux)}
+            camera_controller._store_frame_metadata(request)
+
+        history = camera_controller.get_status_history()
+
+        assert len(history) == METADATA_HISTORY_SIZE
+        assert [meta["Lux"] for _, meta in history] == [
+            float(lux) for lux in range(2, METADATA_HISTORY_SIZE + 2)
+        ]
+        assert history[0][0] <= history[-1][0]
+
+
+class TestCameraControllerReconfigure:
+    """Test combined resolution/framerate/FOV reconfiguration."""
+
+    def test_reconfigure_failure_keeps_fov_mode(self, camera_controller, mock_picamera2):
+        """Test that a failed reconfigure does not keep the new FOV mode."""
+        fov_mode = camera_controller.get_fov_mode()
+        new_fov_mode = "crop" if fov_mode == "scale" else "scale"
+        width, height = camera_controller._current_width, camera_controller._current_height
+        mock_picamera2.configure.side_effect = Exception("Configure failed")
+
+        with pytest.raises(InvalidParameterError, match="reconfiguration failed"):
+            camera_controller.reconfigure(width=1280, height=720, fov_mode=new_fov_mode)
+
+        assert camera_controller.get_fov_mode() == fov_mode
+        assert (camera_controller._current_width, camera_controller._current_height) == (width, height)
+
 
 class TestCameraControllerCleanup:
     """Test resource cleanup."""
@@ -27,8 +27,12 @@ class TestCameraConfig:
         assert config.default_auto_exposure is True
         assert config.host == "0.0.0.0"
         assert config.port == 8000
+        assert config.keep_alive_timeout == 30
+        assert config.system_status_ttl == 1.0
         assert config.api_key is None
         assert config.log_level == "INFO"
+        assert config.log_file is None
+        assert config.access_log is False
 
     def test_environment_variable_override(self, monkeypatch):
         """Test that environment variables override defaults."""
@@ -9,7 +9,7 @@ import pytest
 from unittest.mock import Mock, patch
 
 from camera_service.streaming_manager import StreamingManager
-from camera_service.exceptions import StreamingError
+from camera_service.exceptions import InvalidParameterError, StreamingError
 
 
 class TestStreamingManagerInit:
@@ -152,6 +152,74 @@ class TestStreamingManagerIsStreaming:
         assert streaming_manager.is_streaming() is False
 
 
+class TestStreamingManagerReconfigure:
+    """Test reconfigure method."""
+
+    @patch("camera_service.streaming_manager.H264Encoder")
+    @patch("camera_service.streaming_manager.FfmpegOutput")
+    def test_reconfigure_while_streaming(self, mock_ffmpeg, mock_encoder, streaming_manager, mock_picamera2):
+        """Test that streaming is paused around the change and resumed."""
+        streaming_manager.start()
+        apply = Mock(return_value="applied")
+
+        result = streaming_manager.reconfigure(apply)
+
+        assert result == "applied"
+        apply.assert_called_once()
+        assert streaming_manager.is_streaming() is True
+        assert mock_picamera2.stop_recording.call_count == 1
+        assert mock_picamera2.start_recording.call_count == 2
+
+    @patch("camera_service.streaming_manager.H264Encoder")
+    @patch("camera_service.streaming_manager.FfmpegOutput")
+    def test_reconfigure_without_resume(self, mock_ffmpeg, mock_encoder, streaming_manager, mock_picamera2):
+        """Test that resume=False leaves streaming stopped."""
+        streaming_manager.start()
+
+        streaming_manager.reconfigure(Mock(), resume=False)
+
+        assert streaming_manager.is_streaming() is False
+        assert mock_picamera2.start_recording.call_count == 1
+
+    @patch("camera_service.streaming_manager.H264Encoder")
+    @patch("camera_service.streaming_manager.FfmpegOutput")
+    def test_reconfigure_failure_resumes_streaming(self, mock_ffmpeg, mock_encoder, streaming_manager, mock_picamera2):
+        """Test that streaming is restarted when the change raises."""
+        streaming_manager.start()
+        apply = Mock(side_effect=InvalidParameterError("bad size"))
+
+        with pytest.raises(InvalidParameterError):
+            streaming_manager.reconfigure(apply)
+
+        assert streaming_manager.is_streaming() is True
+        assert mock_picamera2.stop_recording.call_count == 1
+        assert mock_picamera2.start_recording.call_count == 2
+
+    @patch("camera_service.streaming_manager.H264Encoder")
+    @patch("camera_service.streaming_manager.FfmpegOutput")
+    def test_reconfigure_failure_keeps_original_error(self, mock_ffmpeg, mock_encoder, streaming_manager, mock_picamera2):
+        """Test that a failed restart does not mask the reconfiguration error."""
+        streaming_manager.start()
+        mock_picamera2.start_recording.side_effect = Exception("Encoding failed")
+        apply = Mock(side_effect=InvalidParameterError("bad size"))
+
+        with pytest.raises(InvalidParameterError):
+            streaming_manager.reconfigure(apply)
+
+        assert streaming_manager.is_streaming() is False
+
+    def test_reconfigure_when_not_streaming(self, streaming_manager, mock_picamera2):
+        """Test that an idle stream is not started by reconfigure."""
+        apply = Mock()
+
+        streaming_manager.reconfigure(apply)
+
+        apply.assert_called_once()
+        assert streaming_manager.is_streaming() is False
+        mock_picamera2.stop_recording.assert_not_called()
+        mock_picamera2.start_recording.assert_not_called()
+
+
 class TestStreamingManagerLifecycle:
     """Test complete streaming lifecycle."""
 